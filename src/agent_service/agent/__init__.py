@@ -9,7 +9,7 @@ This package provides:
 
 from agent_service.agent.decorators import agent, streaming_agent
 from agent_service.agent.context import AgentContext, UserInfo
-from agent_service.agent.registry import agent_registry, get_default_agent
+from agent_service.agent.registry import agent_registry, get_agent, get_default_agent
 
 __all__ = [
     "agent",
@@ -17,5 +17,6 @@ __all__ = [
     "AgentContext",
     "UserInfo",
     "agent_registry",
+    "get_agent",
     "get_default_agent",
 ]
@@ -81,7 +81,7 @@ class DecoratedAgent(IAgent):
         Returns:
             AgentContext instance
         """
-        from agent_service.tools.registry import tool_registry
+        from agent_service.tools.registry import get_tool_registry
         from agent_service.infrastructure.cache.cache import get_cache
         from agent_service.infrastructure.database.connection import db
         from agent_service.api.middleware.request_id import get_request_id
@@ -118,7 +118,7 @@ class DecoratedAgent(IAgent):
         )
 
         return AgentContext(
-            tools=tool_registry,
+            tools=get_tool_registry(),
             db=db_session,
             cache=cache,
             logger=agent_logger,
@@ -178,3 +178,24 @@ def get_default_agent() -> IAgent:
     if not agent:
         raise RuntimeError("No agent registered")
     return agent
+
+
+def get_agent(name: str) -> IAgent | None:
+    """
+    Get a registered agent by name from the global registry.
+
+    This is a plain dict lookup that returns the registered instance, so
+    callers on hot paths (such as worker tasks) can use it per invocation
+    without caching. Caching the result would go stale when agents are
+    re-registered.
+
+    Args:
+        name: Agent name
+
+    Returns:
+        Agent instance or None if not found
+
+    Example:
+        >>> agent = get_agent("my_agent")
+    """
+    return agent_registry.get(name)
@@ -15,6 +15,7 @@ from agent_service.api.routes import health, auth
 from agent_service.api import v1
 from agent_service.infrastructure.cache.redis import get_redis_manager, close_redis
 from agent_service.infrastructure.database import db
+from agent_service.tools.registry import get_tool_registry
 from agent_service.infrastructure.observability.tracing import (
     init_tracing,
     shutdown_tracing,
@@ -82,6 +83,10 @@ async def lifespan(app: FastAPI):
     else:
         print("Redis is not available - rate limiting will use in-memory storage")
 
+    # Lock the tool set once startup registration is done
+    if settings.tool_registry_freeze:
+        get_tool_registry().freeze()
+
     yield
 
     # Shutdown
@@ -372,7 +372,7 @@ async def invoke_agent_async(
 
     **Task States:**
     - `PENDING`: Task queued, not started yet
-    - `STARTED`: Task is currently running
+    - `STARTED`: Task is currently running (only reported when `CELERY_AGENT_TRACK_STARTED` is enabled)
     - `SUCCESS`: Task completed successfully (result available)
     - `FAILURE`: Task failed (error message available)
     - `RETRY`: Task is being retried after failure
@@ -74,7 +74,7 @@ async def mcp_direct_tool_invocation(tool_name: str, request: Request):
     Returns:
         Tool execution result
     """
-    from agent_service.tools.registry import tool_registry
+    from agent_service.tools.registry import get_tool_registry
 
     if not protocol_registry.is_registered("mcp"):
         return JSONResponse(status_code=404, content={"error": "MCP not enabled"})
@@ -84,7 +84,7 @@ async def mcp_direct_tool_invocation(tool_name: str, request: Request):
         arguments = body.get("arguments", {})
 
         # Execute tool
-        result = await tool_registry.execute(tool_name, **arguments)
+        result = await get_tool_registry().execute(tool_name, **arguments)
 
         return {
             "success": True,
@@ -108,10 +108,10 @@ async def list_mcp_tools():
     if not protocol_registry.is_registered("mcp"):
         return JSONResponse(status_code=404, content={"error": "MCP not enabled"})
 
-    from agent_service.tools.registry import tool_registry
+    from agent_service.tools.registry import get_tool_registry
 
     tools = []
-    for tool_schema in tool_registry.list_tools():
+    for tool_schema in get_tool_registry().list_tools():
         tools.append({
             "name": tool_schema.name,
             "description": tool_schema.description,
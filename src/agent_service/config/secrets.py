@@ -16,9 +16,10 @@ Usage:
 from abc import ABC, abstractmethod
 from functools import lru_cache
 from typing import Any, Literal
-import json
+import copy
 import os
 import time
+import orjson
 from dotenv import load_dotenv
 
 
@@ -134,10 +135,10 @@ class EnvironmentSecretsProvider(ISecretsProvider):
             return None
 
         try:
-            parsed = json.loads(value)
+            parsed = orjson.loads(value)
             _get_logger().debug("Parsed secret as JSON", key=key, success=True)
             return parsed
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             _get_logger().warning("Failed to parse secret as JSON", key=key, error=str(e))
             return None
 
@@ -318,10 +319,10 @@ class AWSSecretsManagerProvider(ISecretsProvider):
             return None
 
         try:
-            parsed = json.loads(value)
+            parsed = orjson.loads(value)
             _get_logger().debug("Parsed AWS secret as JSON", key=key, success=True)
             return parsed
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             _get_logger().warning("Failed to parse AWS secret as JSON", key=key, error=str(e))
             return None
 
@@ -399,10 +400,16 @@ class SecretsManager:
         Args:
             provider: Provider type ("env" or "aws")
             aws_region: AWS region for AWS provider
-            cache_ttl: Cache TTL for AWS provider (seconds)
+            cache_ttl: Cache TTL for AWS provider (seconds); values found in
+                AWS are also cached here for the same time. Environment
+                values are never cached, so changes show up immediately.
         """
         self._provider_type = provider
         self._providers: list[ISecretsProvider] = []
+        self._cache_ttl = cache_ttl
+        # key -> (value, time cached); only values found in AWS are cached
+        self._cache: dict[str, tuple[str, float]] = {}
+        self._json_cache: dict[str, tuple[dict, float]] = {}
 
         # Initialize primary provider
         if provider == "aws":
@@ -431,11 +438,23 @@ class SecretsManager:
             provider_count=len(self._providers)
         )
 
+    def _cached(self, cache: dict[str, tuple[Any, float]], key: str) -> Any | None:
+        """Get a value from one of the lookup caches if it has not expired."""
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        value, timestamp = entry
+        if time.time() - timestamp >= self._cache_ttl:
+            del cache[key]
+            return None
+        return value
+
     def get_secret(self, key: str) -> str | None:
         """
         Get a secret from the provider chain.
 
-        Tries each provider in order until a value is found.
+        Tries each provider in order until a value is found. Values found
+        in AWS are cached for cache_ttl seconds or until refresh().
 
         Args:
             key: Secret key/name
@@ -443,9 +462,15 @@ class SecretsManager:
         Returns:
             Secret value or None if not found in any provider
         """
+        cached = self._cached(self._cache, key)
+        if cached is not None:
+            return cached
+
         for provider in self._providers:
             value = provider.get_secret(key)
             if value is not None:
+                if isinstance(provider, AWSSecretsManagerProvider):
+                    self._cache[key] = (value, time.time())
                 return value
 
         _get_logger().warning("Secret not found in any provider", key=key)
@@ -455,15 +480,25 @@ class SecretsManager:
         """
         Get a secret as JSON from the provider chain.
 
+        Values found in AWS are cached like get_secret(), so repeated
+        lookups skip JSON parsing. Each call returns its own copy.
+
         Args:
             key: Secret key/name
 
         Returns:
             Parsed JSON dict or None if not found or invalid JSON
         """
+        cached = self._cached(self._json_cache, key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
         for provider in self._providers:
             value = provider.get_secret_json(key)
             if value is not None:
+                if isinstance(provider, AWSSecretsManagerProvider):
+                    self._json_cache[key] = (value, time.time())
+                    return copy.deepcopy(value)
                 return value
 
         _get_logger().warning("JSON secret not found in any provider", key=key)
@@ -484,7 +519,9 @@ class SecretsManager:
         return []
 
     def refresh(self) -> None:
-        """Refresh all providers."""
+        """Refresh all providers and drop cached lookups."""
+        self._cache.clear()
+        self._json_cache.clear()
         for provider in self._providers:
             provider.refresh()
         _get_logger().info("Refreshed all secrets providers")
@@ -536,6 +573,24 @@ def get_secrets_manager(force_reload: bool = False) -> SecretsManager:
 # ============================================================================
 
 
+# Default sensitive key patterns (lowercase, matched case-insensitively)
+_DEFAULT_SECRET_KEYS = frozenset({
+    "password",
+    "secret",
+    "token",
+    "api_key",
+    "apikey",
+    "auth",
+    "credentials",
+    "private_key",
+    "access_key",
+    "secret_key",
+    "session_id",
+    "jwt",
+    "bearer",
+})
+
+
 def mask_secret(value: str) -> str:
     """
     Mask a secret value for safe logging.
@@ -552,7 +607,8 @@ def mask_secret(value: str) -> str:
 def mask_secrets_in_dict(
     data: dict,
     keys: list[str] | None = None,
-    default_keys: bool = True
+    default_keys: bool = True,
+    inplace: bool = False,
 ) -> dict:
     """
     Mask sensitive values in a dictionary for safe logging.
@@ -561,59 +617,70 @@ def mask_secrets_in_dict(
         data: Dictionary potentially containing secrets
         keys: Custom list of keys to mask
         default_keys: Include default sensitive key names (default: True)
+        inplace: Mask the top level of data itself instead of a copy.
+            Nested dicts and lists are still copied, so containers owned
+            by the caller are never modified (default: False)
 
     Returns:
-        New dictionary with sensitive values masked
+        Dictionary with sensitive values masked (data itself if inplace)
     """
-    # Default sensitive key patterns (case-insensitive)
-    default_sensitive_keys = {
-        "password",
-        "secret",
-        "token",
-        "api_key",
-        "apikey",
-        "auth",
-        "credentials",
-        "private_key",
-        "access_key",
-        "secret_key",
-        "session_id",
-        "jwt",
-        "bearer",
-    }
-
-    # Build set of keys to mask
-    keys_to_mask = set()
-    if default_keys:
-        keys_to_mask.update(default_sensitive_keys)
+    # Build the set of lowercased patterns to mask
     if keys:
-        keys_to_mask.update(k.lower() for k in keys)
-
-    # Create masked copy
-    masked = {}
-    for key, value in data.items():
-        key_lower = key.lower()
-
-        # Check if key should be masked
-        should_mask = any(sensitive in key_lower for sensitive in keys_to_mask)
-
-        if should_mask and isinstance(value, str):
-            masked[key] = mask_secret(value)
-        elif isinstance(value, dict):
-            # Recursively mask nested dictionaries
-            masked[key] = mask_secrets_in_dict(value, keys, default_keys)
-        elif isinstance(value, list):
-            # Handle lists (mask if items are dicts)
-            masked[key] = [
-                mask_secrets_in_dict(item, keys, default_keys) if isinstance(item, dict) else item
-                for item in value
-            ]
-        else:
-            masked[key] = value
+        custom_keys = frozenset(k.lower() for k in keys)
+        sensitive = _DEFAULT_SECRET_KEYS | custom_keys if default_keys else custom_keys
+    else:
+        sensitive = _DEFAULT_SECRET_KEYS if default_keys else frozenset()
+
+    # Walk the structure with an explicit stack of (source, masked copy)
+    # pairs instead of recursing, so deep events cost no extra frames
+    masked: dict = data if inplace else {}
+    stack = [(data, masked)]
+    while stack:
+        source, target = stack.pop()
+        for key, value in source.items():
+            if isinstance(value, str):
+                if isinstance(key, str) and _is_sensitive_key(key, sensitive):
+                    value = mask_secret(value)
+                target[key] = value
+            elif isinstance(value, dict):
+                # Mask nested dictionaries
+                nested: dict = {}
+                target[key] = nested
+                stack.append((value, nested))
+            elif isinstance(value, list):
+                # Handle lists (mask if items are dicts)
+                items = []
+                for item in value:
+                    if isinstance(item, dict):
+                        nested = {}
+                        stack.append((item, nested))
+                        item = nested
+                    items.append(item)
+                target[key] = items
+            else:
+                target[key] = value
 
     return masked
 
 
+@lru_cache(maxsize=1024)
+def _is_sensitive_key(key: str, sensitive: frozenset[str]) -> bool:
+    """
+    Check whether a key name contains any sensitive pattern.
+
+    Log events reuse a small set of key names, so results are cached.
+
+    Args:
+        key: Key name
+        sensitive: Lowercased sensitive patterns
+
+    Returns:
+        True if the value under this key should be masked
+    """
+    key_lower = key.lower()
+    return any(pattern in key_lower for pattern in sensitive)
+
+
 # ============================================================================
 # Structlog Integration
 # ============================================================================
@@ -640,7 +707,8 @@ def mask_secrets_processor(logger_obj: Any, method_name: str, event_dict: dict)
     Returns:
         Event dictionary with secrets masked
     """
-    return mask_secrets_in_dict(event_dict)
+    # structlog builds a fresh event dict per call, so it can be masked in place
+    return mask_secrets_in_dict(event_dict, inplace=True)
 
 
 # ============================================================================
@@ -135,6 +135,9 @@ class Settings(BaseSettings):
     session_max_messages: int = 100  # Maximum messages per session
     session_expiry_hours: int = 24  # Session expiry time in hours
 
+    # Tool Settings
+    tool_registry_freeze: bool = False  # Freeze the tool registry after startup
+
     # Celery Background Jobs Settings
     celery_broker_url: str = "redis://localhost:6379/1"
     celery_result_backend: str = "redis://localhost:6379/2"
@@ -143,8 +146,11 @@ class Settings(BaseSettings):
     celery_task_max_retries: int = 3
     celery_task_time_limit: int = 600  # 10 minutes max per task
     celery_task_soft_time_limit: int = 540  # 9 minutes soft limit (warning)
-    celery_worker_prefetch_multiplier: int = 4
+    celery_worker_prefetch_multiplier: int = 1  # Agent tasks run for minutes; don't reserve extra
     celery_worker_max_tasks_per_child: int = 1000
+    celery_task_compression: str | None = "gzip"  # gzip, bzip2, zlib or None to disable
+    celery_task_send_sent_event: bool = False  # Extra broker message per task when enabled
+    celery_agent_track_started: bool = False  # Report STARTED state for agent tasks
 
     @property
     def is_production(self) -> bool:
@@ -8,42 +8,93 @@ This package provides:
 - Audit logging
 - Request context management
 - Error tracking with Sentry
+
+Submodules are imported on first attribute access, so importing one
+submodule (for example error_tracking) does not pull in OpenTelemetry.
 """
 
-from agent_service.infrastructure.observability.tracing import (
-    init_tracing,
-    get_tracer,
-    shutdown_tracing,
-    is_tracing_enabled,
-)
-from agent_service.infrastructure.observability.tracing_instrumentation import (
-    instrument_fastapi,
-    instrument_database,
-    instrument_redis,
-    instrument_http_client,
-    add_span_attributes,
-    add_span_event,
-    set_span_error,
-    create_span_name,
-)
-from agent_service.infrastructure.observability.decorators import (
-    traced,
-    traced_async,
-    trace_agent_invocation,
-    trace_tool_execution,
-)
-from agent_service.infrastructure.observability.error_tracking import (
-    init_sentry,
-    set_user_context,
-    set_request_context,
-    capture_exception,
-    capture_message,
-    clear_user_context,
-    add_breadcrumb,
-    set_tag,
-    set_context,
-    flush,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from agent_service.infrastructure.observability.tracing import (
+        init_tracing,
+        get_tracer,
+        shutdown_tracing,
+        is_tracing_enabled,
+    )
+    from agent_service.infrastructure.observability.tracing_instrumentation import (
+        instrument_fastapi,
+        instrument_database,
+        instrument_redis,
+        instrument_http_client,
+        add_span_attributes,
+        add_span_event,
+        set_span_error,
+        create_span_name,
+    )
+    from agent_service.infrastructure.observability.decorators import (
+        traced,
+        traced_async,
+        trace_agent_invocation,
+        trace_tool_execution,
+    )
+    from agent_service.infrastructure.observability.error_tracking import (
+        init_sentry,
+        set_user_context,
+        set_request_context,
+        capture_exception,
+        capture_message,
+        clear_user_context,
+        add_breadcrumb,
+        set_tag,
+        set_context,
+        flush,
+    )
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    "init_tracing": "tracing",
+    "get_tracer": "tracing",
+    "shutdown_tracing": "tracing",
+    "is_tracing_enabled": "tracing",
+    "instrument_fastapi": "tracing_instrumentation",
+    "instrument_database": "tracing_instrumentation",
+    "instrument_redis": "tracing_instrumentation",
+    "instrument_http_client": "tracing_instrumentation",
+    "add_span_attributes": "tracing_instrumentation",
+    "add_span_event": "tracing_instrumentation",
+    "set_span_error": "tracing_instrumentation",
+    "create_span_name": "tracing_instrumentation",
+    "traced": "decorators",
+    "traced_async": "decorators",
+    "trace_agent_invocation": "decorators",
+    "trace_tool_execution": "decorators",
+    "init_sentry": "error_tracking",
+    "set_user_context": "error_tracking",
+    "set_request_context": "error_tracking",
+    "capture_exception": "error_tracking",
+    "capture_message": "error_tracking",
+    "clear_user_context": "error_tracking",
+    "add_breadcrumb": "error_tracking",
+    "set_tag": "error_tracking",
+    "set_context": "error_tracking",
+    "flush": "error_tracking",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     # Core tracing
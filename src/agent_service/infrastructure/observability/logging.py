@@ -260,12 +260,15 @@ def configure_logging() -> None:
     )
 
 
-def get_logger(name: Optional[str] = None) -> structlog.BoundLogger:
+def get_logger(name: Optional[str] = None, **initial_values: Any) -> structlog.BoundLogger:
     """
     Get a logger instance with structured logging support.
 
     Args:
         name: Logger name (typically __name__ of the module)
+        **initial_values: Context bound to every entry from this logger.
+            Unlike ``logger.bind()``, the logger stays lazy, so it is safe to
+            create at import time before logging is configured.
 
     Returns:
         BoundLogger instance with all configured processors
@@ -283,7 +286,7 @@ def get_logger(name: Optional[str] = None) -> structlog.BoundLogger:
         ...     logger.info("action 1")  # Includes user_id
         ...     logger.info("action 2")  # Also includes user_id
     """
-    return structlog.get_logger(name)
+    return structlog.get_logger(name, **initial_values)
 
 
 # Convenience export
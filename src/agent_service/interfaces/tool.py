@@ -34,6 +34,9 @@ class ITool(ABC):
                 ...
     """
 
+    # No instance state here; lets subclasses that define __slots__ drop __dict__
+    __slots__ = ()
+
     @property
     @abstractmethod
     def schema(self) -> ToolSchema:
@@ -8,7 +8,7 @@ from typing import Any
 from pydantic import BaseModel, Field
 
 from agent_service.config.settings import get_settings
-from agent_service.tools.registry import tool_registry
+from agent_service.tools.registry import get_tool_registry
 
 
 class AgentSkill(BaseModel):
@@ -131,7 +131,7 @@ class AgentDiscovery:
         """
         skills = []
 
-        for tool_schema in tool_registry.list_tools():
+        for tool_schema in get_tool_registry().list_tools():
             skill = AgentSkill(
                 name=tool_schema.name,
                 description=tool_schema.description,
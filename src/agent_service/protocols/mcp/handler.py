@@ -157,10 +157,10 @@ class MCPHandler(IProtocolHandler):
         Returns:
             MCP tools list response
         """
-        from agent_service.tools.registry import tool_registry
+        from agent_service.tools.registry import get_tool_registry
 
         tools = []
-        for tool_schema in tool_registry.list_tools():
+        for tool_schema in get_tool_registry().list_tools():
             tools.append({
                 "name": tool_schema.name,
                 "description": tool_schema.description,
@@ -182,7 +182,7 @@ class MCPHandler(IProtocolHandler):
         Returns:
             MCP tool call response
         """
-        from agent_service.tools.registry import tool_registry
+        from agent_service.tools.registry import get_tool_registry
 
         tool_name = params.get("name")
         tool_args = params.get("arguments", {})
@@ -191,7 +191,7 @@ class MCPHandler(IProtocolHandler):
             raise ValueError("Tool name is required")
 
         try:
-            result = await tool_registry.execute(tool_name, **tool_args)
+            result = await get_tool_registry().execute(tool_name, **tool_args)
             return {
                 "content": [
                     {
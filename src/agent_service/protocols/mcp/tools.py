@@ -16,7 +16,8 @@ def register_tools_from_registry(mcp_server: Any) -> None:
     Args:
         mcp_server: FastMCP server instance
     """
-    from agent_service.tools.registry import tool_registry
+    from agent_service.tools.registry import get_tool_registry
+    tool_registry = get_tool_registry()
 
     # Get all registered tools
     tools = tool_registry.list_tools()
@@ -90,7 +91,8 @@ def create_tool_executor(tool_name: str) -> Callable:
     Returns:
         Async function that executes the tool
     """
-    from agent_service.tools.registry import tool_registry
+    from agent_service.tools.registry import get_tool_registry
+    tool_registry = get_tool_registry()
 
     async def execute_tool(**kwargs: Any) -> dict[str, Any]:
         """
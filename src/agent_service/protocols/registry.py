@@ -2,12 +2,16 @@
 from agent_service.interfaces import IProtocolHandler, ProtocolType
 from agent_service.config.settings import get_settings
 
+# Lookup table for protocol names, so invalid names don't go through ValueError
+_NAME_TO_PROTOCOL: dict[str, ProtocolType] = {p.value: p for p in ProtocolType}
+
 
 class ProtocolRegistry:
     """Registry for protocol handlers."""
 
     def __init__(self):
         self._handlers: dict[ProtocolType, IProtocolHandler] = {}
+        self._protocols_cache: tuple[str, ...] | None = None
 
     def register(self, protocol_name: str, handler: IProtocolHandler) -> None:
         """
@@ -18,6 +22,7 @@ class ProtocolRegistry:
             handler: Protocol handler implementation
         """
         self._handlers[handler.protocol_type] = handler
+        self._protocols_cache = None
 
     def get_handler(self, protocol_name: str) -> IProtocolHandler | None:
         """
@@ -29,24 +34,25 @@ class ProtocolRegistry:
         Returns:
             Protocol handler or None if not found
         """
-        try:
-            protocol_type = ProtocolType(protocol_name.lower())
-            return self._handlers.get(protocol_type)
-        except ValueError:
-            return None
+        return self._handlers.get(_NAME_TO_PROTOCOL.get(protocol_name.lower()))
 
     def get(self, protocol: ProtocolType) -> IProtocolHandler | None:
         """Get handler by protocol type (backward compatibility)."""
         return self._handlers.get(protocol)
 
-    def list_protocols(self) -> list[str]:
+    def list_protocols(self) -> tuple[str, ...]:
         """
         List all registered protocol names.
 
+        The result is cached until the next ``register`` call, so frequent
+        callers (health checks) don't rebuild it every time.
+
         Returns:
-            List of protocol names
+            Tuple of protocol names
         """
-        return [protocol.value for protocol in self._handlers.keys()]
+        if self._protocols_cache is None:
+            self._protocols_cache = tuple(protocol.value for protocol in self._handlers)
+        return self._protocols_cache
 
     def is_registered(self, protocol_name: str) -> bool:
         """
@@ -58,11 +64,7 @@ class ProtocolRegistry:
         Returns:
             True if protocol is registered, False otherwise
         """
-        try:
-            protocol_type = ProtocolType(protocol_name.lower())
-            return protocol_type in self._handlers
-        except ValueError:
-            return False
+        return _NAME_TO_PROTOCOL.get(protocol_name.lower()) in self._handlers
 
     def all(self) -> list[IProtocolHandler]:
         """Get all registered handlers."""
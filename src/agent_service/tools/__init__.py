@@ -7,11 +7,13 @@ This package provides:
 - Built-in tools for common operations
 """
 
-from agent_service.tools.decorators import tool, confirmed_tool
-from agent_service.tools.registry import tool_registry
+from agent_service.tools.decorators import tool, confirmed_tool, defer_registration
+from agent_service.tools.registry import get_tool_registry, tool_registry
 
 __all__ = [
     "tool",
     "confirmed_tool",
+    "defer_registration",
+    "get_tool_registry",
     "tool_registry",
 ]
@@ -9,17 +9,21 @@ This package provides ready-to-use tools for:
 All built-in tools are automatically registered when imported.
 """
 
-from agent_service.tools.builtin.http import (
-    http_get,
-    http_post,
-    http_put,
-    http_delete,
-    http_request,
-)
-from agent_service.tools.builtin.sql import (
-    sql_query,
-    sql_execute,
-)
+from agent_service.tools.decorators import defer_registration
+
+# Register all built-in tools as one batch
+with defer_registration():
+    from agent_service.tools.builtin.http import (
+        http_get,
+        http_post,
+        http_put,
+        http_delete,
+        http_request,
+    )
+    from agent_service.tools.builtin.sql import (
+        sql_query,
+        sql_execute,
+    )
 
 __all__ = [
     "http_get",
@@ -6,8 +6,10 @@ read-write modes. Includes query validation, parameter sanitization,
 and result formatting.
 """
 
+from functools import lru_cache
 from typing import Any, Literal
 from sqlalchemy import text
+from sqlalchemy.sql.elements import TextClause
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from agent_service.tools.decorators import tool, confirmed_tool
@@ -60,6 +62,24 @@ def _validate_read_only_query(query: str) -> None:
         )
 
 
+@lru_cache(maxsize=256)
+def _compiled_text(query: str) -> TextClause:
+    """
+    Build a TextClause for a query string, reusing it for repeated queries.
+
+    Agents tend to issue the same templated queries over and over; caching
+    the clause avoids re-parsing the bind parameters on every call. The
+    cache is bounded so ad-hoc queries can't grow it without limit.
+
+    Args:
+        query: SQL query string
+
+    Returns:
+        Cached TextClause for the query
+    """
+    return text(query)
+
+
 def _format_results(rows: list[Any]) -> list[dict[str, Any]]:
     """
     Format SQL results as list of dictionaries.
@@ -153,7 +173,7 @@ async def sql_query(
     async with db.session() as session:
         # Execute query with parameters
         result = await session.execute(
-            text(query),
+            _compiled_text(query),
             params or {},
         )
 
@@ -220,7 +240,7 @@ async def sql_execute(
     async with db.session() as session:
         # Execute statement with parameters
         result = await session.execute(
-            text(query),
+            _compiled_text(query),
             params or {},
         )
 
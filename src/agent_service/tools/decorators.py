@@ -7,10 +7,26 @@ function signature and type annotations.
 """
 
 from __future__ import annotations
-from typing import Callable, Any, get_type_hints, get_origin, get_args, Awaitable
-from functools import wraps
+from typing import (
+    Annotated,
+    Any,
+    Awaitable,
+    Callable,
+    Iterator,
+    Literal,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+from types import FunctionType, UnionType
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache, wraps
+import copy
 import inspect
 import asyncio
+import logging
 import time
 
 from agent_service.interfaces import ITool, ToolSchema
@@ -18,11 +34,103 @@ from agent_service.infrastructure.observability.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Tools waiting to be registered while inside defer_registration()
+_pending_registrations: ContextVar[list[ITool] | None] = ContextVar(
+    "pending_tool_registrations", default=None
+)
+
+
+# Introspection is slow and repeated for the same functions (re-decoration,
+# schema regeneration after reloads), so cache the results per function.
+@lru_cache(maxsize=None)
+def _cached_signature(func: Callable) -> inspect.Signature:
+    """Cached ``inspect.signature``."""
+    return inspect.signature(func)
+
+
+@lru_cache(maxsize=None)
+def _cached_type_hints(func: Callable) -> dict[str, Any]:
+    """
+    Cached type hints of func (treat the result as read-only).
+
+    Concrete annotations are used as-is; ``get_type_hints`` (which evals
+    strings) only runs when some annotation is a string, e.g. under
+    ``from __future__ import annotations``.
+    """
+    annotations = getattr(func, "__annotations__", None)
+    if annotations is None or any(isinstance(v, str) for v in annotations.values()):
+        return get_type_hints(func)
+    return {
+        key: type(None) if value is None else value
+        for key, value in annotations.items()
+    }
+
+
+def _is_async_function(func: Callable) -> bool:
+    """
+    Check whether func is an ``async def`` function.
+
+    Reads the coroutine flag from the code object directly; callables
+    without one (partials, callable objects) go through
+    ``inspect.iscoroutinefunction``.
+    """
+    code = getattr(func, "__code__", None)
+    if code is None:
+        return inspect.iscoroutinefunction(func)
+    return bool(code.co_flags & inspect.CO_COROUTINE)
+
+
+# JSON Schema for basic (non-generic) Python types, stored as immutable
+# (key, value) pairs so the shared table can't be mutated through a result
+_BASIC_TYPE_SCHEMA: dict[Any, tuple[tuple[str, str], ...]] = {
+    str: (("type", "string"),),
+    int: (("type", "integer"),),
+    float: (("type", "number"),),
+    bool: (("type", "boolean"),),
+    dict: (("type", "object"),),
+    list: (("type", "array"),),
+    Any: (),  # Any type - no restriction
+}
+
+# Origins of Optional[T] / Union[...] and PEP 604 ``T | None`` annotations
+_UNION_ORIGINS = (Union, UnionType)
+
+
+def _literal_json_type(values: tuple[Any, ...]) -> str | None:
+    """
+    JSON Schema type shared by all Literal values, or None if they are mixed.
+
+    Example:
+        >>> _literal_json_type(("add", "subtract"))
+        'string'
+        >>> _literal_json_type((1, "one")) is None
+        True
+    """
+    json_types = set()
+    for value in values:
+        # bool before int: bool is an int subclass
+        if isinstance(value, bool):
+            json_types.add("boolean")
+        elif isinstance(value, int):
+            json_types.add("integer")
+        elif isinstance(value, float):
+            json_types.add("number")
+        elif isinstance(value, str):
+            json_types.add("string")
+        elif value is None:
+            json_types.add("null")
+        else:
+            return None
+    return json_types.pop() if len(json_types) == 1 else None
+
 
 def _python_type_to_json_schema(py_type: Any) -> dict[str, Any]:
     """
     Convert Python type annotation to JSON Schema type.
 
+    Results are cached per type and shared between callers, so the
+    returned dict must not be mutated; copy it first.
+
     Args:
         py_type: Python type annotation
 
@@ -35,6 +143,24 @@ def _python_type_to_json_schema(py_type: Any) -> dict[str, Any]:
         >>> _python_type_to_json_schema(int)
         {'type': 'integer'}
     """
+    try:
+        return _cached_type_to_json_schema(py_type)
+    except TypeError:
+        # Unhashable annotations (e.g. Annotated[str, {"max_len": 5}])
+        # can't be cache keys; build their schema uncached
+        return _type_to_json_schema(py_type)
+
+
+def _type_to_json_schema(py_type: Any) -> dict[str, Any]:
+    """Build the JSON Schema for a type; see _python_type_to_json_schema."""
+    # Basic types cover most parameters, so check them before get_origin
+    try:
+        basic = _BASIC_TYPE_SCHEMA.get(py_type)
+    except TypeError:  # Unhashable annotation, can't be a basic type
+        basic = None
+    if basic is not None:
+        return dict(basic)
+
     # Handle None type
     if py_type is type(None):
         return {"type": "null"}
@@ -42,9 +168,21 @@ def _python_type_to_json_schema(py_type: Any) -> dict[str, Any]:
     # Handle string types
     origin = get_origin(py_type)
 
+    # Annotated[T, ...] describes T (metadata is not used for the schema)
+    if origin is Annotated:
+        return _python_type_to_json_schema(get_args(py_type)[0])
+
     # Handle Optional[T] (Union[T, None])
-    if origin is type(None) or str(origin) == "typing.Union":
+    if origin in _UNION_ORIGINS:
         args = get_args(py_type)
+
+        # Fast path for the common two-member T | None case
+        if len(args) == 2:
+            if args[1] is type(None):
+                return {**_python_type_to_json_schema(args[0]), "nullable": True}
+            if args[0] is type(None):
+                return {**_python_type_to_json_schema(args[1]), "nullable": True}
+
         if args:
             # Filter out None type
             non_none_types = [arg for arg in args if arg is not type(None)]
@@ -52,7 +190,7 @@ def _python_type_to_json_schema(py_type: Any) -> dict[str, Any]:
                 schema = _python_type_to_json_schema(non_none_types[0])
                 # Mark as nullable if None was in the union
                 if len(args) > len(non_none_types):
-                    schema["nullable"] = True
+                    schema = {**schema, "nullable": True}
                 return schema
             elif len(non_none_types) > 1:
                 return {
@@ -60,6 +198,14 @@ def _python_type_to_json_schema(py_type: Any) -> dict[str, Any]:
                     "nullable": len(args) > len(non_none_types),
                 }
 
+    # Handle Literal[...] as an enum of its values
+    if origin is Literal:
+        values = get_args(py_type)
+        json_type = _literal_json_type(values)
+        if json_type is None:
+            return {"enum": list(values)}
+        return {"type": json_type, "enum": list(values)}
+
     # Handle list types
     if origin is list:
         args = get_args(py_type)
@@ -80,25 +226,80 @@ def _python_type_to_json_schema(py_type: Any) -> dict[str, Any]:
             }
         return {"type": "object"}
 
-    # Handle basic types
-    type_mapping = {
-        str: {"type": "string"},
-        int: {"type": "integer"},
-        float: {"type": "number"},
-        bool: {"type": "boolean"},
-        dict: {"type": "object"},
-        list: {"type": "array"},
-        Any: {},  # Any type - no restriction
-    }
-
-    # Check if it's a basic type
-    if py_type in type_mapping:
-        return type_mapping[py_type]
-
     # Default to object for unknown types
     return {"type": "object"}
 
 
+_cached_type_to_json_schema = lru_cache(maxsize=None)(_type_to_json_schema)
+
+
+def _get_parameters(func: Callable) -> list[tuple[str, bool]]:
+    """
+    List the named parameters of a function and whether each is required.
+
+    *args and **kwargs are skipped. An explicit ``__signature__`` (set by
+    many wrapping decorators) is used directly, plain functions are read
+    straight from their code object, and anything else (wrapped functions,
+    partials) goes through ``inspect.signature``.
+
+    Args:
+        func: Function to analyze
+
+    Returns:
+        List of (parameter name, required) tuples in declaration order
+
+    Example:
+        >>> def my_func(query: str, limit: int = 10, *, verbose: bool) -> str:
+        ...     pass
+        >>> _get_parameters(my_func)
+        [('query', True), ('limit', False), ('verbose', True)]
+    """
+    signature = getattr(func, "__signature__", None)
+    if not isinstance(signature, inspect.Signature) and (
+        type(func) is not FunctionType or hasattr(func, "__wrapped__")
+    ):
+        signature = _cached_signature(func)
+
+    if signature is not None:
+        return [
+            (param.name, param.default is inspect.Parameter.empty)
+            for param in signature.parameters.values()
+            if param.kind not in (
+                inspect.Parameter.VAR_POSITIONAL,
+                inspect.Parameter.VAR_KEYWORD,
+            )
+        ]
+
+    code = func.__code__
+    positional_count = code.co_argcount
+    names = code.co_varnames[:positional_count + code.co_kwonlyargcount]
+
+    # Positional defaults always belong to the trailing parameters
+    first_default = positional_count - len(func.__defaults__ or ())
+    kw_defaults = func.__kwdefaults__ or {}
+
+    return [
+        (param_name, index < first_default)
+        for index, param_name in enumerate(names[:positional_count])
+    ] + [
+        (param_name, param_name not in kw_defaults)
+        for param_name in names[positional_count:]
+    ]
+
+
+# Parameter schema templates keyed by signature shape:
+# ((name, type, required), ...). Callers get a deep copy.
+_PARAMETERS_CACHE: dict[tuple[tuple[str, Any, bool], ...], dict[str, Any]] = {}
+
+
+def _docstring_summary(func: Callable) -> str:
+    """Return the first line of a function's docstring, or "" if it has none."""
+    doc = func.__doc__
+    if not doc:
+        return ""
+    return doc.strip().split("\n", 1)[0].strip()
+
+
 def _generate_schema_from_function(
     func: Callable,
     name: str,
@@ -113,7 +314,7 @@ def _generate_schema_from_function(
         description: Tool description
 
     Returns:
-        JSON Schema parameters object
+        JSON Schema parameters object, owned by the caller
 
     Example:
         >>> def my_func(query: str, limit: int = 10) -> str:
@@ -122,41 +323,50 @@ def _generate_schema_from_function(
         >>> schema["properties"]["query"]
         {'type': 'string', 'description': ''}
     """
-    sig = inspect.signature(func)
-    type_hints = get_type_hints(func)
+    type_hints = _cached_type_hints(func)
+
+    # The schema depends only on each parameter's name, type and whether it
+    # is required, so tools with identical signatures are built only once
+    shape = tuple(
+        (param_name, type_hints.get(param_name, Any), is_required)
+        for param_name, is_required in _get_parameters(func)
+    )
+    try:
+        cached = _PARAMETERS_CACHE.get(shape)
+        cacheable = True
+    except TypeError:
+        # Unhashable annotations (e.g. Annotated metadata dicts) can't key
+        # the cache; build an uncached schema for this function
+        cached = None
+        cacheable = False
+    if cached is not None:
+        return copy.deepcopy(cached)
 
     properties = {}
     required = []
 
-    for param_name, param in sig.parameters.items():
-        # Skip **kwargs
-        if param.kind == inspect.Parameter.VAR_KEYWORD:
-            continue
-
-        # Skip *args
-        if param.kind == inspect.Parameter.VAR_POSITIONAL:
-            continue
-
-        # Get type annotation
-        param_type = type_hints.get(param_name, Any)
-
-        # Convert to JSON Schema
-        param_schema = _python_type_to_json_schema(param_type)
+    for param_name, param_type, is_required in shape:
+        # Convert to JSON Schema (copy, the mapping result is cached)
+        param_schema = dict(_python_type_to_json_schema(param_type))
 
         # Add description from docstring if available
         param_schema["description"] = ""
 
         properties[param_name] = param_schema
 
-        # Check if required (no default value)
-        if param.default == inspect.Parameter.empty:
+        if is_required:
             required.append(param_name)
 
-    return {
+    schema = {
         "type": "object",
         "properties": properties,
         "required": required,
     }
+    if cacheable:
+        _PARAMETERS_CACHE[shape] = schema
+    # Each tool gets its own copy, nested dicts included, so a consumer
+    # editing one tool's schema can't change another's
+    return copy.deepcopy(schema)
 
 
 class DecoratedTool(ITool):
@@ -171,6 +381,20 @@ class DecoratedTool(ITool):
     - Metrics collection
     """
 
+    # Agents may load hundreds of tools; slots keep each instance small
+    __slots__ = (
+        "_func",
+        "_name",
+        "_description",
+        "_full_description",
+        "_requires_confirmation",
+        "_timeout",
+        "_log",
+        "_invoke",
+        "_parameters",
+        "_schema",
+    )
+
     def __init__(
         self,
         func: Callable[..., Awaitable[Any]],
@@ -194,38 +418,69 @@ class DecoratedTool(ITool):
         self._func = func
         self._name = name
         self._description = description
+        self._full_description: str | None = None
         self._requires_confirmation = requires_confirmation
         self._timeout = timeout
 
-        # Generate schema from function signature
+        # Logger with the tool name bound once rather than passed on every call
+        self._log = get_logger(__name__, tool=name)
+
+        # Pick the invocation path once instead of branching on every call.
+        # No per-tool generated wrapper: execute() must accept **kwargs (ITool),
+        # and arguments are already bound natively when the coroutine is
+        # created, so a generated layer would only add a frame.
+        self._invoke: Callable[..., Awaitable[Any]] = (
+            self._invoke_with_timeout if timeout else func
+        )
+
+        # Generate schema from function signature once; it never changes
         self._parameters = _generate_schema_from_function(func, name, description)
+        self._schema = ToolSchema(
+            name=name,
+            description=description,
+            parameters=self._parameters,
+        )
 
-        # Auto-register if requested
+        # Auto-register if requested (batched when inside defer_registration)
         if auto_register:
-            from agent_service.tools.registry import tool_registry
-
-            tool_registry.register(self)
-            logger.info(
-                "tool_registered",
-                tool=name,
-                description=description,
-                requires_confirmation=requires_confirmation,
-            )
+            pending = _pending_registrations.get()
+            if pending is not None:
+                pending.append(self)
+            else:
+                from agent_service.tools.registry import get_tool_registry
+
+                get_tool_registry().register(self)
+                logger.info(
+                    "tool_registered",
+                    tool=name,
+                    description=description,
+                    requires_confirmation=requires_confirmation,
+                )
 
     @property
     def schema(self) -> ToolSchema:
         """Get tool schema."""
-        return ToolSchema(
-            name=self._name,
-            description=self._description,
-            parameters=self._parameters,
-        )
+        return self._schema
+
+    @property
+    def full_description(self) -> str:
+        """Full, dedented docstring of the tool function (falls back to description)."""
+        if self._full_description is None:
+            doc = self._func.__doc__
+            self._full_description = inspect.cleandoc(doc) if doc else self._description
+        return self._full_description
 
     @property
     def requires_confirmation(self) -> bool:
         """Check if tool requires confirmation."""
         return self._requires_confirmation
 
+    async def _invoke_with_timeout(self, **kwargs: Any) -> Any:
+        """Call the tool function, cancelling it after the configured timeout."""
+        # asyncio.timeout cancels in place, without wrapping the call in a Task
+        async with asyncio.timeout(self._timeout):
+            return await self._func(**kwargs)
+
     async def execute(self, **kwargs: Any) -> Any:
         """
         Execute the tool function with validation and error handling.
@@ -241,39 +496,32 @@ class DecoratedTool(ITool):
             TimeoutError: If execution times out
             Exception: Any exception from the tool function
         """
-        start_time = time.time()
-
-        logger.info(
-            "tool_execution_started",
-            tool=self._name,
-            args=list(kwargs.keys()),
-        )
+        start_time = time.perf_counter()
+
+        # Skip building log payloads that the configured level would drop
+        if self._log.is_enabled_for(logging.INFO):
+            # Argument names are diagnostic detail, only collected for DEBUG
+            self._log.info(
+                "tool_execution_started",
+                args=list(kwargs) if self._log.is_enabled_for(logging.DEBUG) else (),
+            )
 
         try:
-            # Execute with timeout if specified
-            if self._timeout:
-                result = await asyncio.wait_for(
-                    self._func(**kwargs),
-                    timeout=self._timeout,
-                )
-            else:
-                result = await self._func(**kwargs)
+            result = await self._invoke(**kwargs)
 
-            duration = time.time() - start_time
-            logger.info(
-                "tool_execution_completed",
-                tool=self._name,
-                success=True,
-                duration_seconds=duration,
-            )
+            if self._log.is_enabled_for(logging.INFO):
+                self._log.info(
+                    "tool_execution_completed",
+                    success=True,
+                    duration_seconds=time.perf_counter() - start_time,
+                )
 
             return result
 
-        except asyncio.TimeoutError:
-            duration = time.time() - start_time
-            logger.error(
+        except TimeoutError:
+            duration = time.perf_counter() - start_time
+            self._log.error(
                 "tool_execution_timeout",
-                tool=self._name,
                 timeout_seconds=self._timeout,
                 duration_seconds=duration,
             )
@@ -282,10 +530,9 @@ class DecoratedTool(ITool):
             )
 
         except Exception as e:
-            duration = time.time() - start_time
-            logger.error(
+            duration = time.perf_counter() - start_time
+            self._log.error(
                 "tool_execution_failed",
-                tool=self._name,
                 error=str(e),
                 error_type=type(e).__name__,
                 duration_seconds=duration,
@@ -294,6 +541,40 @@ class DecoratedTool(ITool):
             raise
 
 
+@contextmanager
+def defer_registration() -> Iterator[None]:
+    """
+    Batch auto-registration of tools created inside the block.
+
+    Tools decorated within the block are collected and registered with a
+    single ``register_many`` call (and one log line) when the block exits.
+    Nested blocks join the outermost batch.
+
+    Example:
+        >>> with defer_registration():
+        ...     from my_package import search_tools, file_tools
+    """
+    if _pending_registrations.get() is not None:
+        yield
+        return
+
+    pending: list[ITool] = []
+    token = _pending_registrations.set(pending)
+    try:
+        yield
+    finally:
+        _pending_registrations.reset(token)
+        if pending:
+            from agent_service.tools.registry import get_tool_registry
+
+            get_tool_registry().register_many(pending)
+            logger.info(
+                "tools_registered",
+                tools=[t.schema.name for t in pending],
+                count=len(pending),
+            )
+
+
 def tool(
     name: str | None = None,
     description: str | None = None,
@@ -309,7 +590,7 @@ def tool(
 
     Args:
         name: Tool name (defaults to function name)
-        description: Tool description (defaults to function docstring)
+        description: Tool description (defaults to the first line of the docstring)
         requires_confirmation: Whether tool requires user confirmation (default: False)
         timeout: Timeout in seconds (None = no timeout)
         auto_register: Whether to auto-register with the tool registry (default: True)
@@ -355,14 +636,17 @@ def tool(
 
     def decorator(func: Callable[..., Awaitable[Any]]) -> DecoratedTool:
         # Validate function is async
-        if not inspect.iscoroutinefunction(func):
+        if not _is_async_function(func):
             raise TypeError(
                 f"Tool function '{func.__name__}' must be async (use 'async def')"
             )
 
-        # Determine name and description
+        # Determine name and description (only the docstring summary is kept;
+        # the full text is available lazily via DecoratedTool.full_description)
         tool_name = name or func.__name__
-        tool_description = description or func.__doc__ or f"Tool: {tool_name}"
+        tool_description = (
+            description or _docstring_summary(func) or f"Tool: {tool_name}"
+        )
 
         # Create the decorated tool
         decorated = DecoratedTool(
@@ -392,7 +676,7 @@ def confirmed_tool(
 
     Args:
         name: Tool name (defaults to function name)
-        description: Tool description (defaults to function docstring)
+        description: Tool description (defaults to the first line of the docstring)
         timeout: Timeout in seconds (None = no timeout)
         auto_register: Whether to auto-register with the tool registry (default: True)
 
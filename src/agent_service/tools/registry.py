@@ -5,10 +5,48 @@ Tool registry for managing tool instances.
 Supports both class-based tools (ITool implementations) and
 decorator-based tools created with @tool decorator.
 """
-from typing import Any
+import sys
+from typing import Any, Iterable
 from agent_service.interfaces import ITool, ToolSchema
 
 
+class _ToolEntry:
+    """Registered tool with its export formats precomputed at registration."""
+
+    __slots__ = ("tool", "openai", "anthropic")
+
+    def __init__(
+        self,
+        tool: ITool,
+        openai: dict[str, Any],
+        anthropic: dict[str, Any],
+    ):
+        self.tool = tool
+        self.openai = openai
+        self.anthropic = anthropic
+
+
+def _make_entry(tool: ITool) -> _ToolEntry:
+    """Build a registry entry, reading the tool schema once."""
+    schema = tool.schema
+    return _ToolEntry(
+        tool=tool,
+        openai={
+            "type": "function",
+            "function": {
+                "name": schema.name,
+                "description": schema.description,
+                "parameters": schema.parameters,
+            }
+        },
+        anthropic={
+            "name": schema.name,
+            "description": schema.description,
+            "input_schema": schema.parameters,
+        },
+    )
+
+
 class ToolRegistry:
     """
     Registry for tool implementations.
@@ -31,19 +69,71 @@ class ToolRegistry:
     """
 
     def __init__(self):
-        self._tools: dict[str, ITool] = {}
+        self._tools: dict[str, _ToolEntry] = {}
+        # Export caches, rebuilt lazily after the tool set changes
+        self._openai_cache: tuple[dict[str, Any], ...] | None = None
+        self._anthropic_cache: tuple[dict[str, Any], ...] | None = None
+        # Set by freeze(); the tool set can no longer change after that
+        self._frozen = False
+        self._names: tuple[str, ...] = ()
+        self._schemas: tuple[ToolSchema, ...] = ()
+
+    def _check_mutable(self) -> None:
+        """Raise if the registry has been frozen."""
+        if self._frozen:
+            raise RuntimeError("Tool registry is frozen")
+
+    def _invalidate_caches(self) -> None:
+        """Drop cached exports after the tool set changes."""
+        self._openai_cache = None
+        self._anthropic_cache = None
 
     def register(self, tool: ITool) -> None:
         """
         Register a tool.
 
+        Re-registering the same tool object is a no-op, and replacing a tool
+        with one whose schema is identical keeps the cached exports.
+
         Args:
             tool: Tool instance (ITool implementation)
 
         Example:
             >>> registry.register(MyTool())
         """
-        self._tools[tool.schema.name] = tool
+        self._check_mutable()
+        schema = tool.schema
+        # Interned keys let dict lookups short-circuit on identity
+        name = sys.intern(schema.name)
+        existing = self._tools.get(name)
+        if existing is not None:
+            if existing.tool is tool:
+                return
+            if existing.tool.schema == schema:
+                # Exports are unchanged; swap the implementation and keep
+                # the cached export lists.
+                self._tools[name] = _ToolEntry(tool, existing.openai, existing.anthropic)
+                return
+
+        self._tools[name] = _make_entry(tool)
+        self._invalidate_caches()
+
+    def register_many(self, tools: Iterable[ITool]) -> None:
+        """
+        Register several tools in one call.
+
+        Args:
+            tools: Tool instances (ITool implementations)
+
+        Example:
+            >>> registry.register_many([MyTool(), OtherTool()])
+        """
+        self._check_mutable()
+        batch = {sys.intern(tool.schema.name): _make_entry(tool) for tool in tools}
+        # Merging a dict (rather than an iterable of pairs) lets CPython
+        # resize the table once for the whole batch.
+        self._tools.update(batch)
+        self._invalidate_caches()
 
     def unregister(self, name: str) -> None:
         """
@@ -55,8 +145,9 @@ class ToolRegistry:
         Example:
             >>> registry.unregister("my_tool")
         """
-        if name in self._tools:
-            del self._tools[name]
+        self._check_mutable()
+        if self._tools.pop(name, None) is not None:
+            self._invalidate_caches()
 
     def get(self, name: str) -> ITool | None:
         """
@@ -71,7 +162,8 @@ class ToolRegistry:
         Example:
             >>> tool = registry.get("my_tool")
         """
-        return self._tools.get(name)
+        entry = self._tools.get(name)
+        return entry.tool if entry is not None else None
 
     def list_tools(self) -> list[ToolSchema]:
         """
@@ -85,7 +177,9 @@ class ToolRegistry:
             >>> for schema in schemas:
             ...     print(f"{schema.name}: {schema.description}")
         """
-        return [t.schema for t in self._tools.values()]
+        if self._frozen:
+            return list(self._schemas)
+        return [entry.tool.schema for entry in self._tools.values()]
 
     def list_tool_names(self) -> list[str]:
         """
@@ -99,12 +193,18 @@ class ToolRegistry:
             >>> print(names)
             ['tool1', 'tool2', 'tool3']
         """
+        if self._frozen:
+            return list(self._names)
         return list(self._tools.keys())
 
     def to_openai_format(self) -> list[dict[str, Any]]:
         """
         Export tools in OpenAI function calling format.
 
+        The export is cached until the registry changes; each call returns
+        a new list, but the tool dicts in it are shared, so copy one before
+        editing it.
+
         Returns:
             List of tools in OpenAI format
 
@@ -116,22 +216,18 @@ class ToolRegistry:
             ...     tools=tools
             ... )
         """
-        return [
-            {
-                "type": "function",
-                "function": {
-                    "name": t.schema.name,
-                    "description": t.schema.description,
-                    "parameters": t.schema.parameters,
-                }
-            }
-            for t in self._tools.values()
-        ]
+        if self._openai_cache is None:
+            self._openai_cache = tuple(entry.openai for entry in self._tools.values())
+        return list(self._openai_cache)
 
     def to_anthropic_format(self) -> list[dict[str, Any]]:
         """
         Export tools in Anthropic Claude format.
 
+        The export is cached until the registry changes; each call returns
+        a new list, but the tool dicts in it are shared, so copy one before
+        editing it.
+
         Returns:
             List of tools in Anthropic format
 
@@ -143,14 +239,9 @@ class ToolRegistry:
             ...     tools=tools
             ... )
         """
-        return [
-            {
-                "name": t.schema.name,
-                "description": t.schema.description,
-                "input_schema": t.schema.parameters,
-            }
-            for t in self._tools.values()
-        ]
+        if self._anthropic_cache is None:
+            self._anthropic_cache = tuple(entry.anthropic for entry in self._tools.values())
+        return list(self._anthropic_cache)
 
     async def execute(self, name: str, **kwargs: Any) -> Any:
         """
@@ -170,10 +261,37 @@ class ToolRegistry:
         Example:
             >>> result = await registry.execute("web_search", query="Python")
         """
-        tool = self.get(name)
-        if not tool:
-            raise ValueError(f"Tool not found: {name}")
-        return await tool.execute(**kwargs)
+        try:
+            entry = self._tools[name]
+        except KeyError:
+            raise ValueError(f"Tool not found: {name}") from None
+        return await entry.tool.execute(**kwargs)
+
+    def freeze(self) -> None:
+        """
+        Freeze the registry once the tool set is final.
+
+        Builds the export lists and the tool name/schema listings up front,
+        after which register, register_many, unregister and clear raise
+        RuntimeError. Call this after startup when tools are not added
+        at runtime. Freezing twice is a no-op.
+
+        Example:
+            >>> registry.register_many([MyTool(), OtherTool()])
+            >>> registry.freeze()
+        """
+        if self._frozen:
+            return
+        self._names = tuple(self._tools)
+        self._schemas = tuple(entry.tool.schema for entry in self._tools.values())
+        self.to_openai_format()
+        self.to_anthropic_format()
+        self._frozen = True
+
+    @property
+    def is_frozen(self) -> bool:
+        """Whether freeze() has been called."""
+        return self._frozen
 
     def clear(self) -> None:
         """
@@ -182,8 +300,30 @@ class ToolRegistry:
         Example:
             >>> registry.clear()
         """
+        self._check_mutable()
         self._tools.clear()
+        self._invalidate_caches()
 
 
 # Global registry
-tool_registry = ToolRegistry()
+_tool_registry: ToolRegistry | None = None
+
+
+def get_tool_registry() -> ToolRegistry:
+    """
+    Get the global tool registry instance.
+
+    Prefer this over importing the registry object directly so the
+    implementation can be swapped without touching call sites.
+
+    Returns:
+        Global ToolRegistry instance
+    """
+    global _tool_registry
+    if _tool_registry is None:
+        _tool_registry = ToolRegistry()
+    return _tool_registry
+
+
+# Backward compatibility
+tool_registry = get_tool_registry()
@@ -0,0 +1,64 @@
+"""
+Periodic task schedule for Celery beat.
+
+The schedule is only needed by the beat process, so it is kept out of the
+worker configuration and installed by LazyBeatScheduler when beat builds
+its scheduler. Worker processes never import this module.
+"""
+
+from typing import Any, Dict
+
+from celery.beat import PersistentScheduler
+from celery.schedules import crontab
+
+
+def load_beat_schedule() -> Dict[str, Dict[str, Any]]:
+    """
+    Build the periodic task schedule.
+
+    Returns:
+        Mapping of schedule entry name to Celery beat entry
+    """
+    return {
+        # Session cleanup - runs every hour
+        "cleanup-expired-sessions": {
+            "task": "agent_service.workers.tasks.cleanup_tasks.cleanup_expired_sessions",
+            "schedule": crontab(minute=0),  # Every hour at minute 0
+            "options": {"queue": "cleanup-tasks"},
+        },
+        # Audit log archival - runs daily at 2 AM
+        "archive-old-audit-logs": {
+            "task": "agent_service.workers.tasks.cleanup_tasks.archive_old_audit_logs",
+            "schedule": crontab(hour=2, minute=0),  # Daily at 2:00 AM
+            "options": {"queue": "cleanup-tasks"},
+        },
+        # Token blacklist cleanup - runs every 6 hours
+        "cleanup-token-blacklist": {
+            "task": "agent_service.workers.tasks.cleanup_tasks.cleanup_token_blacklist",
+            "schedule": crontab(minute=0, hour="*/6"),  # Every 6 hours
+            "options": {"queue": "cleanup-tasks"},
+        },
+        # Temp file cleanup - runs daily at 3 AM
+        "cleanup-temp-files": {
+            "task": "agent_service.workers.tasks.cleanup_tasks.cleanup_temp_files",
+            "schedule": crontab(hour=3, minute=0),  # Daily at 3:00 AM
+            "options": {"queue": "cleanup-tasks"},
+        },
+    }
+
+
+class LazyBeatScheduler(PersistentScheduler):
+    """
+    Persistent scheduler that installs the default schedule on startup.
+
+    An explicitly configured beat_schedule takes precedence over the
+    default one.
+    """
+
+    def setup_schedule(self) -> None:
+        if not self.app.conf.beat_schedule:
+            self.app.conf.beat_schedule = load_beat_schedule()
+        super().setup_schedule()
+
+
+__all__ = ["load_beat_schedule", "LazyBeatScheduler"]
@@ -12,8 +12,10 @@ This module configures Celery with:
 Configuration is loaded from application settings.
 """
 
+import logging
+import zlib
+
 from celery import Celery, Task
-from celery.schedules import crontab
 from celery.signals import (
     task_prerun,
     task_postrun,
@@ -23,8 +25,16 @@ from celery.signals import (
 from kombu import Queue
 
 from agent_service.config.settings import get_settings
+from agent_service.infrastructure.observability.logging import get_logger
+from agent_service.workers.serialization import (
+    ORJSON_SERIALIZER,
+    register_orjson_serializer,
+)
 
 settings = get_settings()
+logger = get_logger(__name__)
+
+register_orjson_serializer()
 
 
 # ============================================================================
@@ -48,9 +58,16 @@ celery_app = Celery(
 
 celery_app.conf.update(
     # Task Configuration
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    # orjson for speed; plain json still accepted for messages queued by
+    # producers that predate the switch.
+    task_serializer=ORJSON_SERIALIZER,
+    accept_content=[ORJSON_SERIALIZER, "json"],
+    result_serializer=ORJSON_SERIALIZER,
+    result_accept_content=[ORJSON_SERIALIZER, "json"],
+    # Prompts and agent responses are text-heavy; compressing bodies cuts
+    # broker and result backend memory for a small amount of worker CPU.
+    task_compression=settings.celery_task_compression,
+    result_compression=settings.celery_task_compression,
     timezone="UTC",
     enable_utc=True,
 
@@ -63,6 +80,13 @@ celery_app.conf.update(
     task_reject_on_worker_lost=True,  # Reject tasks if worker dies
 
     # Worker Configuration
+    # Prefetch applies per worker, not per queue. Agent tasks run for minutes,
+    # so the default multiplier is 1 to stop one worker hoarding reserved
+    # tasks. Run agent and cleanup tasks in separate worker groups so that
+    # recycling a worker stuck on a long invocation only redelivers agent
+    # tasks, and let the cleanup group prefetch more:
+    #   celery -A agent_service.workers.celery_app worker -Q agent-tasks --prefetch-multiplier=1 --concurrency=8
+    #   celery -A agent_service.workers.celery_app worker -Q cleanup-tasks --prefetch-multiplier=4 --concurrency=2
     worker_prefetch_multiplier=settings.celery_worker_prefetch_multiplier,
     worker_max_tasks_per_child=settings.celery_worker_max_tasks_per_child,
     worker_disable_rate_limits=False,
@@ -110,37 +134,16 @@ celery_app.conf.update(
     # Rate Limits (global)
     task_default_rate_limit="1000/m",  # 1000 tasks per minute by default
 
-    # Error Handling
-    task_track_started=True,  # Track when tasks start
-    task_send_sent_event=True,  # Send task-sent events
-
-    # Periodic Tasks (Beat Schedule)
-    beat_schedule={
-        # Session cleanup - runs every hour
-        "cleanup-expired-sessions": {
-            "task": "agent_service.workers.tasks.cleanup_tasks.cleanup_expired_sessions",
-            "schedule": crontab(minute=0),  # Every hour at minute 0
-            "options": {"queue": "cleanup-tasks"},
-        },
-        # Audit log archival - runs daily at 2 AM
-        "archive-old-audit-logs": {
-            "task": "agent_service.workers.tasks.cleanup_tasks.archive_old_audit_logs",
-            "schedule": crontab(hour=2, minute=0),  # Daily at 2:00 AM
-            "options": {"queue": "cleanup-tasks"},
-        },
-        # Token blacklist cleanup - runs every 6 hours
-        "cleanup-token-blacklist": {
-            "task": "agent_service.workers.tasks.cleanup_tasks.cleanup_token_blacklist",
-            "schedule": crontab(minute=0, hour="*/6"),  # Every 6 hours
-            "options": {"queue": "cleanup-tasks"},
-        },
-        # Temp file cleanup - runs daily at 3 AM
-        "cleanup-temp-files": {
-            "task": "agent_service.workers.tasks.cleanup_tasks.cleanup_temp_files",
-            "schedule": crontab(hour=3, minute=0),  # Daily at 3:00 AM
-            "options": {"queue": "cleanup-tasks"},
-        },
-    },
+    # Task State Events
+    # Each of these costs an extra broker/backend write per task, so they are
+    # off by default. Low-volume tasks opt back in with track_started=True.
+    task_track_started=False,
+    task_send_sent_event=settings.celery_task_send_sent_event,
+
+    # Periodic Tasks
+    # The schedule lives in beat_schedule.py and is only loaded by the beat
+    # process, so workers don't build crontab entries they never use.
+    beat_scheduler="agent_service.workers.beat_schedule:LazyBeatScheduler",
 )
 
 
@@ -161,9 +164,33 @@ class BaseTask(Task):
 
     autoretry_for = (Exception,)
     max_retries = settings.celery_task_max_retries
-    retry_backoff = True  # Exponential backoff
-    retry_backoff_max = 600  # Max 10 minutes between retries
-    retry_jitter = True  # Add random jitter to backoff
+    # Backoff comes from _BACKOFF_SCHEDULE in retry() rather than Celery's
+    # per-retry computation.
+    retry_backoff = False
+
+    # Exponential backoff in seconds, capped at 10 minutes
+    _BACKOFF_SCHEDULE = tuple(min(2 ** n, 600) for n in range(11))
+
+    def retry(self, args=None, kwargs=None, exc=None, throw=True,
+              eta=None, countdown=None, max_retries=None, **options):
+        """
+        Retry the task, defaulting the delay to the backoff schedule.
+
+        When neither countdown nor eta is given, the delay is taken from
+        _BACKOFF_SCHEDULE for the current retry number with full jitter.
+        The jitter is derived from the task id, so a given task retries on
+        the same schedule every time.
+        """
+        if countdown is None and eta is None:
+            retries = self.request.retries
+            schedule = self._BACKOFF_SCHEDULE
+            delay = schedule[min(retries, len(schedule) - 1)]
+            seed = zlib.crc32(f"{self.request.id}:{retries}".encode())
+            countdown = seed % (delay + 1)
+        return super().retry(
+            args=args, kwargs=kwargs, exc=exc, throw=throw, eta=eta,
+            countdown=countdown, max_retries=max_retries, **options,
+        )
 
     def on_failure(self, exc, task_id, args, kwargs, einfo):
         """
@@ -176,7 +203,13 @@ class BaseTask(Task):
             kwargs: Keyword arguments of the task
             einfo: Exception info with traceback
         """
-        print(f"Task {self.name}[{task_id}] failed: {exc}")
+        logger.error(
+            "task_failed",
+            task_name=self.name,
+            task_id=task_id,
+            error=str(exc),
+            error_type=type(exc).__name__,
+        )
         # In production, send to error tracking service (Sentry)
         # sentry_sdk.capture_exception(exc)
 
@@ -191,7 +224,14 @@ class BaseTask(Task):
             kwargs: Keyword arguments of the task
             einfo: Exception info with traceback
         """
-        print(f"Task {self.name}[{task_id}] retry {self.request.retries}/{self.max_retries}: {exc}")
+        logger.warning(
+            "task_retrying",
+            task_name=self.name,
+            task_id=task_id,
+            retries=self.request.retries,
+            max_retries=self.max_retries,
+            error=str(exc),
+        )
 
     def on_success(self, retval, task_id, args, kwargs):
         """
@@ -203,7 +243,8 @@ class BaseTask(Task):
             args: Positional arguments of the task
             kwargs: Keyword arguments of the task
         """
-        print(f"Task {self.name}[{task_id}] succeeded")
+        if logger.is_enabled_for(logging.INFO):
+            logger.info("task_succeeded", task_name=self.name, task_id=task_id)
 
 
 # Set the default base task class
@@ -214,7 +255,12 @@ celery_app.Task = BaseTask
 # Celery Signal Handlers
 # ============================================================================
 
-@task_prerun.connect
+# prerun/postrun fire for every task but only log at DEBUG, so they are only
+# connected when debug output is wanted. A signal with no receivers costs
+# next to nothing to send.
+_TRACE_TASK_LIFECYCLE = settings.debug or settings.log_level <= logging.DEBUG
+
+
 def task_prerun_handler(task_id, task, args, kwargs, **extra_kwargs):
     """
     Handler called before task execution.
@@ -224,10 +270,10 @@ def task_prerun_handler(task_id, task, args, kwargs, **extra_kwargs):
     - Logging task start
     - Initializing resources
     """
-    print(f"Starting task {task.name}[{task_id}]")
+    if logger.is_enabled_for(logging.DEBUG):
+        logger.debug("task_started", task_name=task.name, task_id=task_id)
 
 
-@task_postrun.connect
 def task_postrun_handler(task_id, task, args, kwargs, retval, **extra_kwargs):
     """
     Handler called after task execution.
@@ -237,7 +283,13 @@ def task_postrun_handler(task_id, task, args, kwargs, retval, **extra_kwargs):
     - Logging task completion
     - Resource disposal
     """
-    print(f"Completed task {task.name}[{task_id}]")
+    if logger.is_enabled_for(logging.DEBUG):
+        logger.debug("task_completed", task_name=task.name, task_id=task_id)
+
+
+if _TRACE_TASK_LIFECYCLE:
+    task_prerun.connect(task_prerun_handler)
+    task_postrun.connect(task_postrun_handler)
 
 
 @task_failure.connect
@@ -250,7 +302,10 @@ def task_failure_handler(task_id, exception, args, kwargs, traceback, einfo, **e
     - Alerting
     - Cleanup after failure
     """
-    print(f"Task {task_id} failed with exception: {exception}")
+    # BaseTask.on_failure already logs at ERROR with the task name; this
+    # handler also fires for tasks that do not use BaseTask.
+    if logger.is_enabled_for(logging.DEBUG):
+        logger.debug("task_failure_signal", task_id=task_id, error=str(exception))
 
 
 @task_retry.connect
@@ -263,7 +318,8 @@ def task_retry_handler(task_id, reason, einfo, **extra_kwargs):
     - Tracking retry patterns
     - Alerting on excessive retries
     """
-    print(f"Task {task_id} retry: {reason}")
+    if logger.is_enabled_for(logging.DEBUG):
+        logger.debug("task_retry_signal", task_id=task_id, reason=str(reason))
 
 
 # ============================================================================
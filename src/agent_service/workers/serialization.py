@@ -0,0 +1,57 @@
+"""
+Message serialization for Celery task bodies and results.
+
+Registers an orjson-backed serializer with kombu so task payloads
+(prompts, agent responses, streaming chunks) are encoded by a native
+JSON implementation instead of the stdlib ``json`` module. The wire
+format is still plain JSON, so any consumer that understands
+``application/json`` can read it.
+"""
+
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from kombu.serialization import register
+
+ORJSON_SERIALIZER = "orjson"
+ORJSON_CONTENT_TYPE = "application/x-orjson"
+
+
+def _default(obj: Any) -> Any:
+    """Encode types orjson does not handle natively."""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def orjson_dumps(obj: Any) -> bytes:
+    """Serialize a task body or result to JSON bytes."""
+    return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def orjson_loads(data: bytes | str) -> Any:
+    """Deserialize a task body or result from JSON."""
+    return orjson.loads(data)
+
+
+def register_orjson_serializer() -> None:
+    """Register the orjson serializer with kombu's serializer registry."""
+    register(
+        ORJSON_SERIALIZER,
+        orjson_dumps,
+        orjson_loads,
+        content_type=ORJSON_CONTENT_TYPE,
+        content_encoding="utf-8",
+    )
+
+
+__all__ = [
+    "ORJSON_SERIALIZER",
+    "ORJSON_CONTENT_TYPE",
+    "orjson_dumps",
+    "orjson_loads",
+    "register_orjson_serializer",
+]
@@ -16,23 +16,103 @@ Tasks in this module are designed to handle:
 """
 
 import asyncio
+import time
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, Optional
 from uuid import UUID
 
 from celery import Task
 from celery.exceptions import SoftTimeLimitExceeded
+from redis.asyncio import Redis
 
 from agent_service.workers.celery_app import celery_app
+from agent_service.workers.serialization import orjson_dumps
 from agent_service.agent.registry import get_agent
 from agent_service.interfaces.agent import AgentInput, AgentOutput
-from agent_service.infrastructure.cache.redis import get_redis_manager
+from agent_service.infrastructure.cache.redis import RedisManager, get_redis_manager
+from agent_service.infrastructure.observability.logging import get_logger
+from agent_service.config.settings import get_settings
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+# Minimum spacing between throttled (per-chunk) progress writes of a task
+_PROGRESS_MIN_INTERVAL = 0.1  # seconds
+
+# Last progress written per task in this worker process:
+# task_id -> (progress, status, message)
+_last_progress: Dict[str, tuple[int, str, Optional[str]]] = {}
+
+# (epoch second, ISO-8601 string) for the most recent progress timestamp
+_timestamp_cache: tuple[int, str] = (0, "")
+
+# Longest a successful task waits on Redis to cache its result
+_RESULT_WRITE_TIMEOUT = 0.5  # seconds
+
+# Redis manager resolved on first use by this worker process
+_redis_manager: Optional[RedisManager] = None
 
 
 # ============================================================================
 # Helper Functions
 # ============================================================================
 
+async def _get_redis_client() -> Optional[Redis]:
+    """
+    Get the Redis client for progress and result writes.
+
+    The manager is resolved once per worker process; after that this only
+    checks availability.
+
+    Returns:
+        Redis client if available, None otherwise
+    """
+    global _redis_manager
+
+    if _redis_manager is None:
+        _redis_manager = await get_redis_manager()
+    return _redis_manager.get_client()
+
+
+def _result_key(task_id: str) -> str:
+    """Cache key for a task's stored result."""
+    return f"task_result:{task_id}"
+
+
+def _progress_key(task_id: str) -> str:
+    """Cache key for a task's progress record."""
+    return f"task_progress:{task_id}"
+
+
+def _utc_timestamp() -> str:
+    """
+    Current UTC time as an ISO-8601 string at one-second resolution.
+
+    The string is rebuilt only when the second changes, so progress
+    updates in a tight loop reuse it instead of formatting a datetime.
+    """
+    global _timestamp_cache
+
+    second = int(time.time())
+    if _timestamp_cache[0] != second:
+        _timestamp_cache = (second, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second)))
+    return _timestamp_cache[1]
+
+
+def _progress_payload(
+    progress: int,
+    status: str,
+    message: Optional[str],
+) -> Dict[str, Any]:
+    """Build the progress record stored under the progress key."""
+    return {
+        "progress": progress,
+        "status": status,
+        "message": message,
+        "updated_at": _utc_timestamp(),
+    }
+
+
 async def _store_result_in_cache(
     task_id: str,
     result: Dict[str, Any],
@@ -46,10 +126,10 @@ async def _store_result_in_cache(
         result: The result data to store
         ttl: Time to live in seconds (default: 1 hour)
     """
-    redis_manager = await get_redis_manager()
-    if redis_manager.is_available:
-        cache_key = f"task_result:{task_id}"
-        await redis_manager.set(cache_key, result, ttl=ttl)
+    _last_progress.pop(task_id, None)
+    client = await _get_redis_client()
+    if client is not None:
+        await client.set(_result_key(task_id), orjson_dumps(result), ex=ttl)
 
 
 async def _update_task_progress(
@@ -61,37 +141,302 @@ async def _update_task_progress(
     """
     Update task progress in cache.
 
+    The write is skipped when progress, status and message are all
+    unchanged since the last write for this task.
+
     Args:
         task_id: The Celery task ID
         progress: Progress percentage (0-100)
         status: Current status message
         message: Optional additional message
     """
-    redis_manager = await get_redis_manager()
-    if redis_manager.is_available:
-        progress_key = f"task_progress:{task_id}"
-        progress_data = {
-            "progress": progress,
-            "status": status,
-            "message": message,
-            "updated_at": datetime.utcnow().isoformat(),
-        }
-        await redis_manager.set(progress_key, progress_data, ttl=3600)
+    state = (progress, status, message)
+    if _last_progress.get(task_id) == state:
+        return
+
+    client = await _get_redis_client()
+    if client is not None:
+        _last_progress[task_id] = state
+        progress_data = _progress_payload(progress, status, message)
+        await client.set(_progress_key(task_id), orjson_dumps(progress_data), ex=3600)
+
+
+class _ProgressWriter:
+    """
+    Issues a task's progress and cache writes in the background.
+
+    Each write is scheduled on the running loop and chained after the
+    previous one, so writes land in order without the task waiting on
+    Redis. A failed write is dropped; it never fails the task.
+
+    Throttled updates closer than _PROGRESS_MIN_INTERVAL to the previous
+    write are held back; only the newest one is kept, and it is written
+    by the next unthrottled update or by drain().
+    """
+
+    def __init__(self, task_id: str):
+        self._task_id = task_id
+        self._last: Optional[asyncio.Task] = None
+        self._last_write_at = 0.0
+        self._pending: Optional[tuple[int, str, Optional[str]]] = None
+
+    def update(
+        self,
+        progress: int,
+        status: str = "processing",
+        message: Optional[str] = None,
+        throttle: bool = False,
+    ) -> None:
+        """
+        Schedule a progress update.
+
+        Args:
+            progress: Progress percentage (0-100)
+            status: Current status message
+            message: Optional additional message
+            throttle: Hold the update back if the previous write was less
+                than _PROGRESS_MIN_INTERVAL ago (for per-chunk updates)
+        """
+        now = time.monotonic()
+        if throttle and now - self._last_write_at < _PROGRESS_MIN_INTERVAL:
+            self._pending = (progress, status, message)
+            return
+
+        self._pending = None
+        self._last_write_at = now
+        self._write_progress(progress, status, message)
+
+    def _write_progress(
+        self,
+        progress: int,
+        status: str,
+        message: Optional[str],
+    ) -> None:
+        self.schedule(
+            lambda: _update_task_progress(self._task_id, progress, status, message),
+            "task_progress_write_failed",
+        )
+
+    def schedule(self, write: Callable[[], Awaitable[Any]], event: str) -> None:
+        """
+        Schedule a write after the ones already pending.
+
+        Args:
+            write: Callable returning the awaitable that performs the write
+            event: Log event emitted if the write fails
+        """
+        previous = self._last
+
+        async def run() -> None:
+            if previous is not None:
+                await asyncio.wait([previous])
+            try:
+                await write()
+            except Exception as e:
+                logger.warning(event, task_id=self._task_id, error=str(e))
+
+        self._last = asyncio.create_task(run())
+
+    async def drain(self) -> None:
+        """Write any held-back update and wait for scheduled writes to finish."""
+        if self._pending is not None:
+            self._write_progress(*self._pending)
+            self._pending = None
+        if self._last is not None:
+            await asyncio.wait([self._last])
+            self._last = None
+
+
+async def _flush_progress_and_result(
+    task_id: str,
+    result: Dict[str, Any],
+    progress: int,
+    status: str,
+    message: Optional[str] = None,
+    ttl: int = 3600,
+) -> None:
+    """
+    Store the task result and its final progress in one round trip.
+
+    Both SETs are sent in a single non-transactional pipeline, so finishing
+    a task costs one Redis RTT instead of two.
+
+    Args:
+        task_id: The Celery task ID
+        result: The result data to store
+        progress: Progress percentage (0-100)
+        status: Current status message
+        message: Optional additional message
+        ttl: Time to live in seconds for both keys (default: 1 hour)
+    """
+    _last_progress.pop(task_id, None)
+    client = await _get_redis_client()
+    if client is None:
+        return
+
+    progress_data = _progress_payload(progress, status, message)
+    async with client.pipeline(transaction=False) as pipe:
+        pipe.set(_result_key(task_id), orjson_dumps(result), ex=ttl)
+        pipe.set(_progress_key(task_id), orjson_dumps(progress_data), ex=ttl)
+        await pipe.execute()
+
+
+async def _append_chunks(
+    client: Redis,
+    key: str,
+    payloads: list[bytes],
+    ttl: int = 3600,
+    replace: bool = False,
+) -> None:
+    """
+    Append serialized streaming chunks to a task's chunk list.
+
+    Args:
+        client: Redis client
+        key: Chunk list key
+        payloads: Serialized chunks to append, in order
+        ttl: Time to live in seconds for the list (default: 1 hour)
+        replace: Drop any list left by a previous attempt first
+    """
+    async with client.pipeline(transaction=False) as pipe:
+        if replace:
+            pipe.delete(key)
+        pipe.rpush(key, *payloads)
+        pipe.expire(key, ttl)
+        await pipe.execute()
+
+
+async def _store_completed_result(
+    progress_writer: _ProgressWriter,
+    task_id: str,
+    result: Dict[str, Any],
+    message: str,
+) -> None:
+    """
+    Finish pending writes and store a successful result in the cache.
+
+    The result is also returned to Celery's result backend, so the cache
+    copy is not worth holding the worker for: if Redis does not answer
+    within _RESULT_WRITE_TIMEOUT the remaining writes are dropped, and a
+    failed write is logged rather than raised.
+
+    Args:
+        progress_writer: The task's background writer
+        task_id: The Celery task ID
+        result: The result data to store
+        message: Final progress message
+    """
+
+    async def store() -> None:
+        await progress_writer.drain()
+        await _flush_progress_and_result(
+            task_id,
+            result,
+            progress=100,
+            status="completed",
+            message=message,
+        )
+
+    try:
+        await asyncio.wait_for(store(), timeout=_RESULT_WRITE_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning("task_result_cache_timeout", task_id=task_id)
+    except Exception as e:
+        # The invocation already succeeded; a cache write must never fail
+        # (and so retry) the task
+        logger.warning("task_result_cache_write_failed", task_id=task_id, error=str(e))
+    finally:
+        # The flush clears this too, but not if the timeout cut it short
+        _last_progress.pop(task_id, None)
+
+
+def _make_error_result(
+    task_id: str,
+    agent_id: str,
+    started_at: datetime,
+    status: str,
+    error: str,
+    result: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Build the result stored for a failed or timed-out invocation.
+
+    Args:
+        task_id: The Celery task ID
+        agent_id: The agent identifier
+        started_at: When the task started
+        status: Task status ("failed" or "timeout")
+        error: Error message
+        result: Partial result collected before the failure, if any
+
+    Returns:
+        Error result dictionary
+    """
+    return {
+        "task_id": task_id,
+        "agent_id": agent_id,
+        "result": result,
+        "status": status,
+        "started_at": started_at.isoformat(),
+        "completed_at": datetime.utcnow().isoformat(),
+        "error": error,
+    }
+
+
+async def _run_storing_error_result(
+    task_id: str,
+    invocation: Awaitable[Dict[str, Any]],
+    make_error_result: Callable[[Exception], Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    Await an invocation, storing an error result if it raises.
+
+    The error result is written on the invocation's own event loop, so the
+    cached Redis client is still usable. Write failures are logged and the
+    original exception is re-raised.
+
+    Args:
+        task_id: The Celery task ID
+        invocation: The invocation coroutine
+        make_error_result: Builds the error result from the raised exception
+
+    Returns:
+        The invocation's result
+    """
+    try:
+        return await invocation
+    except Exception as e:
+        try:
+            await _store_result_in_cache(task_id, make_error_result(e), ttl=3600)
+        except Exception as store_error:
+            logger.warning(
+                "task_error_result_cache_write_failed",
+                task_id=task_id,
+                error=str(store_error),
+            )
+        raise
 
 
 # ============================================================================
 # Agent Invocation Tasks
 # ============================================================================
 
-@celery_app.task(
+# Options shared by the long-running agent invocation tasks
+_LONG_TASK_OPTS: Dict[str, Any] = dict(
     bind=True,
-    name="agent_service.workers.tasks.agent_tasks.invoke_agent_async",
     max_retries=3,
     default_retry_delay=60,
+    track_started=settings.celery_agent_track_started,
+    acks_late=True,  # Redeliver if the worker dies mid-invocation
+    reject_on_worker_lost=True,
+)
+
+@celery_app.task(
+    **_LONG_TASK_OPTS,
+    name="agent_service.workers.tasks.agent_tasks.invoke_agent_async",
     rate_limit="100/m",  # 100 invocations per minute
     time_limit=600,  # 10 minutes hard limit
     soft_time_limit=540,  # 9 minutes soft limit
-    track_started=True,
 )
 def invoke_agent_async(
     self: Task,
@@ -135,14 +480,16 @@ def invoke_agent_async(
     task_id = self.request.id
     started_at = datetime.utcnow()
 
-    try:
+    async def run_invocation() -> Dict[str, Any]:
+        """Run the whole invocation on a single event loop."""
+        progress_writer = _ProgressWriter(task_id)
+
         # Update progress: Starting
-        asyncio.run(_update_task_progress(
-            task_id,
+        progress_writer.update(
             progress=0,
             status="starting",
             message=f"Starting agent invocation for agent: {agent_id}",
-        ))
+        )
 
         # Get the agent from registry
         agent = get_agent(agent_id)
@@ -150,12 +497,11 @@ def invoke_agent_async(
             raise ValueError(f"Agent not found: {agent_id}")
 
         # Update progress: Agent retrieved
-        asyncio.run(_update_task_progress(
-            task_id,
+        progress_writer.update(
             progress=20,
             status="processing",
             message="Agent retrieved, preparing invocation",
-        ))
+        )
 
         # Prepare agent input
         agent_input = AgentInput(
@@ -164,23 +510,21 @@ def invoke_agent_async(
         )
 
         # Update progress: Invoking agent
-        asyncio.run(_update_task_progress(
-            task_id,
+        progress_writer.update(
             progress=40,
             status="processing",
             message="Invoking agent",
-        ))
+        )
 
-        # Invoke the agent (async)
-        agent_output: AgentOutput = asyncio.run(agent.invoke(agent_input))
+        # Invoke the agent
+        agent_output: AgentOutput = await agent.invoke(agent_input)
 
         # Update progress: Agent responded
-        asyncio.run(_update_task_progress(
-            task_id,
+        progress_writer.update(
             progress=80,
             status="processing",
             message="Agent responded, storing result",
-        ))
+        )
 
         # Prepare result
         result = {
@@ -198,80 +542,49 @@ def invoke_agent_async(
             "error": None,
         }
 
-        # Store result in cache for quick retrieval
-        asyncio.run(_store_result_in_cache(task_id, result, ttl=3600))
-
-        # Update progress: Complete
-        asyncio.run(_update_task_progress(
+        # Store result and final progress for quick retrieval
+        await _store_completed_result(
+            progress_writer,
             task_id,
-            progress=100,
-            status="completed",
+            result,
             message="Task completed successfully",
-        ))
+        )
 
         return result
 
-    except SoftTimeLimitExceeded:
-        # Soft time limit exceeded - log and continue
-        print(f"Task {task_id} soft time limit exceeded, attempting to finish gracefully")
+    def make_error_result(e: Exception) -> Dict[str, Any]:
+        if isinstance(e, SoftTimeLimitExceeded):
+            return _make_error_result(
+                task_id, agent_id, started_at, "timeout", "Agent invocation exceeded time limit"
+            )
+        return _make_error_result(task_id, agent_id, started_at, "failed", str(e))
 
-        error_result = {
-            "task_id": task_id,
-            "agent_id": agent_id,
-            "result": None,
-            "status": "timeout",
-            "started_at": started_at.isoformat(),
-            "completed_at": datetime.utcnow().isoformat(),
-            "error": "Agent invocation exceeded time limit",
-        }
+    try:
+        return asyncio.run(
+            _run_storing_error_result(task_id, run_invocation(), make_error_result)
+        )
 
-        asyncio.run(_store_result_in_cache(task_id, error_result, ttl=3600))
+    except SoftTimeLimitExceeded:
+        # Soft time limit exceeded - the error result is already stored
+        logger.error("agent_task_soft_time_limit_exceeded", task_id=task_id, agent_id=agent_id)
         raise TimeoutError("Agent invocation exceeded time limit")
 
-    except ValueError as e:
-        # Invalid input or agent not found
-        error_result = {
-            "task_id": task_id,
-            "agent_id": agent_id,
-            "result": None,
-            "status": "failed",
-            "started_at": started_at.isoformat(),
-            "completed_at": datetime.utcnow().isoformat(),
-            "error": str(e),
-        }
-
-        asyncio.run(_store_result_in_cache(task_id, error_result, ttl=3600))
+    except ValueError:
+        # Invalid input or agent not found - don't retry
         raise
 
     except Exception as e:
         # Unexpected error - log and retry
-        print(f"Task {task_id} failed with error: {e}")
-
-        error_result = {
-            "task_id": task_id,
-            "agent_id": agent_id,
-            "result": None,
-            "status": "failed",
-            "started_at": started_at.isoformat(),
-            "completed_at": datetime.utcnow().isoformat(),
-            "error": str(e),
-        }
-
-        asyncio.run(_store_result_in_cache(task_id, error_result, ttl=3600))
-
-        # Retry the task
+        logger.error("agent_task_failed", task_id=task_id, agent_id=agent_id, error=str(e))
         raise self.retry(exc=e, countdown=self.default_retry_delay)
 
 
 @celery_app.task(
-    bind=True,
+    **_LONG_TASK_OPTS,
     name="agent_service.workers.tasks.agent_tasks.invoke_agent_with_streaming",
-    max_retries=3,
-    default_retry_delay=60,
     rate_limit="50/m",  # 50 streaming invocations per minute
     time_limit=900,  # 15 minutes hard limit for streaming
     soft_time_limit=840,  # 14 minutes soft limit
-    track_started=True,
 )
 def invoke_agent_with_streaming(
     self: Task,
@@ -314,8 +627,9 @@ def invoke_agent_with_streaming(
     task_id = self.request.id
     started_at = datetime.utcnow()
     chunks = []
+    content_parts = []
 
-    async def collect_streaming_response():
+    async def collect_streaming_response(progress_writer: _ProgressWriter):
         """Helper function to collect streaming response."""
         nonlocal chunks
 
@@ -331,48 +645,65 @@ def invoke_agent_with_streaming(
         )
 
         # Update progress
-        await _update_task_progress(
-            task_id,
+        progress_writer.update(
             progress=10,
             status="streaming",
             message="Starting streaming response",
         )
 
+        # Intermediate chunks are cached in the background so the stream
+        # never waits on Redis
+        cache_key = f"task_chunks:{task_id}"
+        client = await _get_redis_client()
+
         # Stream the response
         chunk_count = 0
+        flushed = 0
+        # Chunks between two milestones share one timestamp
+        now_iso = datetime.utcnow().isoformat()
         async for chunk in agent.stream(agent_input):
             chunk_count += 1
+            content_parts.append(chunk.content)
             chunks.append({
                 "index": chunk_count,
                 "content": chunk.content,
                 "metadata": chunk.metadata,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": now_iso,
             })
 
             # Update progress every 10 chunks
             if chunk_count % 10 == 0:
+                now_iso = datetime.utcnow().isoformat()
                 progress = min(90, 10 + (chunk_count * 2))  # Cap at 90%
-                await _update_task_progress(
-                    task_id,
+                progress_writer.update(
                     progress=progress,
                     status="streaming",
                     message=f"Received {chunk_count} chunks",
+                    throttle=True,
                 )
 
-                # Store intermediate chunks in cache
-                cache_key = f"task_chunks:{task_id}"
-                redis_manager = await get_redis_manager()
-                if redis_manager.is_available:
-                    await redis_manager.set(cache_key, chunks, ttl=3600)
+                # Append the chunks received since the last milestone
+                if client is not None:
+                    payloads = [orjson_dumps(c) for c in chunks[flushed:]]
+                    progress_writer.schedule(
+                        lambda payloads=payloads, replace=flushed == 0: _append_chunks(
+                            client, cache_key, payloads, replace=replace
+                        ),
+                        "task_chunks_write_failed",
+                    )
+                    flushed = len(chunks)
 
         return chunks
 
-    try:
+    async def run_streaming() -> Dict[str, Any]:
+        """Collect the stream and store the result on a single event loop."""
+        progress_writer = _ProgressWriter(task_id)
+
         # Collect all streaming chunks
-        chunks = asyncio.run(collect_streaming_response())
+        await collect_streaming_response(progress_writer)
 
         # Combine all chunk content
-        complete_content = "".join([chunk["content"] for chunk in chunks])
+        complete_content = "".join(content_parts)
 
         # Prepare result
         result = {
@@ -391,54 +722,49 @@ def invoke_agent_with_streaming(
             "error": None,
         }
 
-        # Store result in cache
-        asyncio.run(_store_result_in_cache(task_id, result, ttl=3600))
-
-        # Update progress: Complete
-        asyncio.run(_update_task_progress(
+        # Store result and final progress
+        await _store_completed_result(
+            progress_writer,
             task_id,
-            progress=100,
-            status="completed",
+            result,
             message=f"Streaming completed with {len(chunks)} chunks",
-        ))
+        )
 
         return result
 
-    except SoftTimeLimitExceeded:
-        print(f"Task {task_id} soft time limit exceeded during streaming")
+    def make_error_result(e: Exception) -> Dict[str, Any]:
+        if isinstance(e, SoftTimeLimitExceeded):
+            return _make_error_result(
+                task_id,
+                agent_id,
+                started_at,
+                "timeout",
+                f"Streaming timeout after {len(chunks)} chunks",
+                result={
+                    "content": "".join(content_parts),
+                    "chunks": chunks,
+                    "chunk_count": len(chunks),
+                    "partial": True,
+                },
+            )
+        return _make_error_result(task_id, agent_id, started_at, "failed", str(e))
 
-        error_result = {
-            "task_id": task_id,
-            "agent_id": agent_id,
-            "result": {
-                "content": "".join([c["content"] for c in chunks]),
-                "chunks": chunks,
-                "chunk_count": len(chunks),
-                "partial": True,
-            },
-            "status": "timeout",
-            "started_at": started_at.isoformat(),
-            "completed_at": datetime.utcnow().isoformat(),
-            "error": f"Streaming timeout after {len(chunks)} chunks",
-        }
+    try:
+        return asyncio.run(
+            _run_storing_error_result(task_id, run_streaming(), make_error_result)
+        )
 
-        asyncio.run(_store_result_in_cache(task_id, error_result, ttl=3600))
+    except SoftTimeLimitExceeded:
+        logger.error(
+            "agent_streaming_soft_time_limit_exceeded",
+            task_id=task_id,
+            agent_id=agent_id,
+            chunk_count=len(chunks),
+        )
         raise TimeoutError(f"Streaming timeout after {len(chunks)} chunks")
 
     except Exception as e:
-        print(f"Task {task_id} failed during streaming: {e}")
-
-        error_result = {
-            "task_id": task_id,
-            "agent_id": agent_id,
-            "result": None,
-            "status": "failed",
-            "started_at": started_at.isoformat(),
-            "completed_at": datetime.utcnow().isoformat(),
-            "error": str(e),
-        }
-
-        asyncio.run(_store_result_in_cache(task_id, error_result, ttl=3600))
+        logger.error("agent_streaming_failed", task_id=task_id, agent_id=agent_id, error=str(e))
         raise self.retry(exc=e, countdown=self.default_retry_delay)
 
 
@@ -12,13 +12,19 @@ They're configured in the beat_schedule in celery_app.py.
 """
 
 import asyncio
+import errno
 import os
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 
+import orjson
 from celery import Task
+from celery.exceptions import SoftTimeLimitExceeded
+from redis.asyncio import Redis
 from sqlalchemy import delete, select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -27,9 +33,11 @@ from agent_service.infrastructure.database import db
 from agent_service.infrastructure.database.models.session import Session
 from agent_service.infrastructure.database.models.audit_log import AuditLog
 from agent_service.infrastructure.cache.redis import get_redis_manager
+from agent_service.infrastructure.observability.logging import get_logger
 from agent_service.config.settings import get_settings
 
 settings = get_settings()
+logger = get_logger(__name__)
 
 
 # ============================================================================
@@ -43,17 +51,17 @@ settings = get_settings()
     default_retry_delay=300,  # 5 minutes
     time_limit=600,  # 10 minutes
     soft_time_limit=540,
+    track_started=True,
 )
 def cleanup_expired_sessions(self: Task) -> Dict[str, Any]:
     """
     Clean up expired sessions from the database.
 
     This task:
-    1. Finds all sessions older than the expiry threshold
-    2. Deletes expired sessions
-    3. Returns statistics about cleanup
+    1. Deletes all sessions older than the expiry threshold in one statement
+    2. Returns statistics about cleanup
 
-    Runs: Every hour (configured in beat_schedule)
+    Runs: Every hour (configured in workers/beat_schedule.py)
 
     Returns:
         Dictionary containing:
@@ -63,12 +71,12 @@ def cleanup_expired_sessions(self: Task) -> Dict[str, Any]:
             - completed_at: When cleanup completed
     """
     started_at = datetime.utcnow()
-    print(f"Starting session cleanup at {started_at}")
+    logger.info("session_cleanup_started")
 
     async def cleanup():
         """Async cleanup implementation."""
         if not db._engine:
-            print("Database not configured, skipping session cleanup")
+            logger.info("session_cleanup_skipped", reason="database_not_configured")
             return {
                 "deleted_count": 0,
                 "status": "skipped",
@@ -80,14 +88,7 @@ def cleanup_expired_sessions(self: Task) -> Dict[str, Any]:
 
         async with db.session() as session:
             try:
-                # Find expired sessions
-                stmt = select(Session).where(
-                    Session.updated_at < cutoff_time
-                )
-                result = await session.execute(stmt)
-                expired_sessions = result.scalars().all()
-
-                # Delete expired sessions
+                # Delete expired sessions; rowcount gives the number removed
                 delete_stmt = delete(Session).where(
                     Session.updated_at < cutoff_time
                 )
@@ -96,7 +97,11 @@ def cleanup_expired_sessions(self: Task) -> Dict[str, Any]:
 
                 deleted_count = result.rowcount
 
-                print(f"Deleted {deleted_count} expired sessions (cutoff: {cutoff_time})")
+                logger.info(
+                    "session_cleanup_completed",
+                    deleted_count=deleted_count,
+                    cutoff_time=cutoff_time.isoformat(),
+                )
 
                 return {
                     "deleted_count": deleted_count,
@@ -106,7 +111,7 @@ def cleanup_expired_sessions(self: Task) -> Dict[str, Any]:
 
             except Exception as e:
                 await session.rollback()
-                print(f"Error during session cleanup: {e}")
+                logger.error("session_cleanup_error", error=str(e))
                 raise
 
     try:
@@ -119,7 +124,7 @@ def cleanup_expired_sessions(self: Task) -> Dict[str, Any]:
         }
 
     except Exception as e:
-        print(f"Session cleanup failed: {e}")
+        logger.error("session_cleanup_failed", error=str(e))
         raise self.retry(exc=e, countdown=self.default_retry_delay)
 
 
@@ -127,6 +132,16 @@ def cleanup_expired_sessions(self: Task) -> Dict[str, Any]:
 # Audit Log Archival Tasks
 # ============================================================================
 
+# Rows fetched per round trip and written per file write
+_ARCHIVE_BATCH_SIZE = 1000
+_ARCHIVE_WRITE_BUFFER = 1024 * 1024
+# Rows deleted per transaction once archived
+_ARCHIVE_DELETE_BATCH = 10000
+# orjson encodes UUIDs and datetimes natively; naive timestamps are UTC
+_ARCHIVE_JSON_OPTIONS = orjson.OPT_SERIALIZE_UUID | orjson.OPT_NAIVE_UTC
+# Archive location (in production, use S3 or similar)
+_ARCHIVE_DIR = Path("/tmp/audit_logs_archive")
+
 @celery_app.task(
     bind=True,
     name="agent_service.workers.tasks.cleanup_tasks.archive_old_audit_logs",
@@ -134,6 +149,7 @@ def cleanup_expired_sessions(self: Task) -> Dict[str, Any]:
     default_retry_delay=600,  # 10 minutes
     time_limit=1800,  # 30 minutes
     soft_time_limit=1680,  # 28 minutes
+    track_started=True,
 )
 def archive_old_audit_logs(self: Task) -> Dict[str, Any]:
     """
@@ -145,7 +161,7 @@ def archive_old_audit_logs(self: Task) -> Dict[str, Any]:
     3. Deletes archived logs from primary database
     4. Returns archival statistics
 
-    Runs: Daily at 2 AM (configured in beat_schedule)
+    Runs: Daily at 2 AM (configured in workers/beat_schedule.py)
 
     Returns:
         Dictionary containing:
@@ -156,12 +172,12 @@ def archive_old_audit_logs(self: Task) -> Dict[str, Any]:
             - status: Task status
     """
     started_at = datetime.utcnow()
-    print(f"Starting audit log archival at {started_at}")
+    logger.info("audit_log_archival_started")
 
     async def archive():
         """Async archival implementation."""
         if not db._engine:
-            print("Database not configured, skipping audit log archival")
+            logger.info("audit_log_archival_skipped", reason="database_not_configured")
             return {
                 "archived_count": 0,
                 "deleted_count": 0,
@@ -174,73 +190,108 @@ def archive_old_audit_logs(self: Task) -> Dict[str, Any]:
 
         async with db.session() as session:
             try:
-                # Find old audit logs
-                stmt = select(AuditLog).where(
-                    AuditLog.timestamp < cutoff_time
-                )
-                result = await session.execute(stmt)
-                old_logs = result.scalars().all()
-
-                archived_count = len(old_logs)
-
-                if archived_count == 0:
-                    print("No audit logs to archive")
-                    return {
-                        "archived_count": 0,
-                        "deleted_count": 0,
-                        "status": "success",
-                        "message": "no_logs_to_archive",
-                    }
-
                 # Archive to file system (in production, use S3 or similar)
-                archive_dir = Path("/tmp/audit_logs_archive")
-                archive_dir.mkdir(parents=True, exist_ok=True)
+                _ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
+
+                # One file per run: deletes are committed in batches, so a
+                # retry after a partial delete must not replace the archive
+                # holding the rows that are already gone from the table
+                archive_filename = (
+                    f"audit_logs_{cutoff_time.strftime('%Y%m%d')}"
+                    f"_{started_at.strftime('%Y%m%dT%H%M%S%f')}.jsonl"
+                )
+                archive_path = _ARCHIVE_DIR / archive_filename
+                partial_path = archive_path.with_name(archive_filename + ".partial")
 
-                archive_filename = f"audit_logs_{cutoff_time.strftime('%Y%m%d')}.jsonl"
-                archive_path = archive_dir / archive_filename
+                # Stream old audit logs instead of loading them all, and write
+                # them to the archive file (JSONL format) in batches
+                stmt = select(AuditLog).where(
+                    AuditLog.timestamp < cutoff_time
+                ).execution_options(yield_per=_ARCHIVE_BATCH_SIZE)
 
-                # Write logs to archive file (JSONL format)
-                import json
-                with open(archive_path, "w") as f:
-                    for log in old_logs:
+                archived_count = 0
+                with open(partial_path, "wb", buffering=_ARCHIVE_WRITE_BUFFER) as f:
+                    batch: List[bytes] = []
+                    async for log in await session.stream_scalars(stmt):
                         log_data = {
-                            "id": str(log.id),
-                            "user_id": str(log.user_id) if log.user_id else None,
+                            "id": log.id,
+                            "user_id": log.user_id,
                             "action": log.action,
                             "resource_type": log.resource_type,
                             "resource_id": log.resource_id,
-                            "timestamp": log.timestamp.isoformat(),
+                            "timestamp": log.timestamp,
                             "ip_address": log.ip_address,
                             "user_agent": log.user_agent,
                             "request_id": log.request_id,
                             "metadata": log.metadata,
                         }
-                        f.write(json.dumps(log_data) + "\n")
+                        batch.append(orjson.dumps(log_data, option=_ARCHIVE_JSON_OPTIONS) + b"\n")
+                        if len(batch) >= _ARCHIVE_BATCH_SIZE:
+                            f.write(b"".join(batch))
+                            archived_count += len(batch)
+                            batch.clear()
+                    if batch:
+                        f.write(b"".join(batch))
+                        archived_count += len(batch)
+
+                if archived_count == 0:
+                    partial_path.unlink(missing_ok=True)
+                    logger.info("audit_log_archival_empty")
+                    return {
+                        "archived_count": 0,
+                        "deleted_count": 0,
+                        "status": "success",
+                        "message": "no_logs_to_archive",
+                    }
 
-                print(f"Archived {archived_count} logs to {archive_path}")
+                partial_path.replace(archive_path)
 
-                # Delete archived logs from database
-                delete_stmt = delete(AuditLog).where(
+                # Delete archived logs from database in batches, committing
+                # each one so a large backlog never becomes one long
+                # transaction. Batches committed before a soft time limit
+                # stay deleted; the rest are picked up by the next run.
+                batch_ids = select(AuditLog.id).where(
                     AuditLog.timestamp < cutoff_time
-                )
-                result = await session.execute(delete_stmt)
-                await session.commit()
-
-                deleted_count = result.rowcount
+                ).limit(_ARCHIVE_DELETE_BATCH)
+                delete_stmt = delete(AuditLog).where(
+                    AuditLog.id.in_(batch_ids)
+                ).execution_options(synchronize_session=False)
 
-                print(f"Deleted {deleted_count} archived logs from database")
+                deleted_count = 0
+                status = "success"
+                try:
+                    while True:
+                        result = await session.execute(delete_stmt)
+                        await session.commit()
+                        deleted_count += result.rowcount
+                        if result.rowcount < _ARCHIVE_DELETE_BATCH:
+                            break
+                except SoftTimeLimitExceeded:
+                    await session.rollback()
+                    status = "partial"
+                    logger.warning(
+                        "audit_log_delete_interrupted",
+                        deleted_count=deleted_count,
+                    )
+
+                logger.info(
+                    "audit_log_archival_completed",
+                    archived_count=archived_count,
+                    deleted_count=deleted_count,
+                    archive_path=str(archive_path),
+                )
 
                 return {
                     "archived_count": archived_count,
                     "deleted_count": deleted_count,
                     "archive_path": str(archive_path),
                     "cutoff_time": cutoff_time.isoformat(),
-                    "status": "success",
+                    "status": status,
                 }
 
             except Exception as e:
                 await session.rollback()
-                print(f"Error during audit log archival: {e}")
+                logger.error("audit_log_archival_error", error=str(e))
                 raise
 
     try:
@@ -253,7 +304,7 @@ def archive_old_audit_logs(self: Task) -> Dict[str, Any]:
         }
 
     except Exception as e:
-        print(f"Audit log archival failed: {e}")
+        logger.error("audit_log_archival_failed", error=str(e))
         raise self.retry(exc=e, countdown=self.default_retry_delay)
 
 
@@ -261,6 +312,37 @@ def archive_old_audit_logs(self: Task) -> Dict[str, Any]:
 # Token Blacklist Cleanup Tasks
 # ============================================================================
 
+# Keys per SCAN page and per TTL/DEL pipeline
+_BLACKLIST_SCAN_BATCH = 500
+
+
+async def _remove_unexpiring_keys(client: Redis, keys: List[str]) -> int:
+    """
+    Delete keys in a batch that have no TTL.
+
+    Looks up all TTLs in one pipeline and deletes the keys that would never
+    expire with a single DEL.
+
+    Args:
+        client: Redis client
+        keys: Keys to check
+
+    Returns:
+        Number of keys removed or already gone
+    """
+    async with client.pipeline(transaction=False) as pipe:
+        for key in keys:
+            pipe.ttl(key)
+        ttls = await pipe.execute()
+
+    # -1: no expiry set (shouldn't happen, but clean up anyway)
+    # -2: key expired between SCAN and TTL
+    unexpiring = [key for key, ttl in zip(keys, ttls) if ttl == -1]
+    if unexpiring:
+        await client.delete(*unexpiring)
+    return len(unexpiring) + sum(1 for ttl in ttls if ttl == -2)
+
+
 @celery_app.task(
     bind=True,
     name="agent_service.workers.tasks.cleanup_tasks.cleanup_token_blacklist",
@@ -268,6 +350,7 @@ def archive_old_audit_logs(self: Task) -> Dict[str, Any]:
     default_retry_delay=300,
     time_limit=300,  # 5 minutes
     soft_time_limit=270,
+    track_started=True,
 )
 def cleanup_token_blacklist(self: Task) -> Dict[str, Any]:
     """
@@ -279,7 +362,7 @@ def cleanup_token_blacklist(self: Task) -> Dict[str, Any]:
     3. Removes expired tokens
     4. Returns cleanup statistics
 
-    Runs: Every 6 hours (configured in beat_schedule)
+    Runs: Every 6 hours (configured in workers/beat_schedule.py)
 
     Returns:
         Dictionary containing:
@@ -288,14 +371,14 @@ def cleanup_token_blacklist(self: Task) -> Dict[str, Any]:
             - status: Task status
     """
     started_at = datetime.utcnow()
-    print(f"Starting token blacklist cleanup at {started_at}")
+    logger.info("token_blacklist_cleanup_started")
 
     async def cleanup():
         """Async cleanup implementation."""
         redis_manager = await get_redis_manager()
 
         if not redis_manager.is_available:
-            print("Redis not available, skipping token blacklist cleanup")
+            logger.info("token_blacklist_cleanup_skipped", reason="redis_not_available")
             return {
                 "removed_count": 0,
                 "scanned_count": 0,
@@ -304,23 +387,29 @@ def cleanup_token_blacklist(self: Task) -> Dict[str, Any]:
             }
 
         try:
-            # Get all blacklisted token keys
+            client = redis_manager.get_client()
             pattern = "blacklist:token:*"
-            keys = await redis_manager.client.keys(pattern)
-
-            scanned_count = len(keys)
+            scanned_count = 0
             removed_count = 0
 
-            # Check each token and remove if expired
-            for key in keys:
-                ttl = await redis_manager.client.ttl(key)
-                if ttl == -1:  # No expiry set (shouldn't happen, but clean up anyway)
-                    await redis_manager.client.delete(key)
-                    removed_count += 1
-                elif ttl == -2:  # Key doesn't exist
-                    removed_count += 1
-
-            print(f"Cleaned up {removed_count} expired tokens from blacklist (scanned {scanned_count})")
+            # SCAN instead of KEYS so Redis isn't blocked on large keyspaces;
+            # keys are checked in pipelined batches
+            batch: List[str] = []
+            async for key in client.scan_iter(match=pattern, count=_BLACKLIST_SCAN_BATCH):
+                batch.append(key)
+                if len(batch) >= _BLACKLIST_SCAN_BATCH:
+                    removed_count += await _remove_unexpiring_keys(client, batch)
+                    scanned_count += len(batch)
+                    batch = []
+            if batch:
+                removed_count += await _remove_unexpiring_keys(client, batch)
+                scanned_count += len(batch)
+
+            logger.info(
+                "token_blacklist_cleanup_completed",
+                removed_count=removed_count,
+                scanned_count=scanned_count,
+            )
 
             return {
                 "removed_count": removed_count,
@@ -329,7 +418,7 @@ def cleanup_token_blacklist(self: Task) -> Dict[str, Any]:
             }
 
         except Exception as e:
-            print(f"Error during token blacklist cleanup: {e}")
+            logger.error("token_blacklist_cleanup_error", error=str(e))
             raise
 
     try:
@@ -342,7 +431,7 @@ def cleanup_token_blacklist(self: Task) -> Dict[str, Any]:
         }
 
     except Exception as e:
-        print(f"Token blacklist cleanup failed: {e}")
+        logger.error("token_blacklist_cleanup_failed", error=str(e))
         raise self.retry(exc=e, countdown=self.default_retry_delay)
 
 
@@ -350,6 +439,108 @@ def cleanup_token_blacklist(self: Task) -> Dict[str, Any]:
 # Temporary File Cleanup Tasks
 # ============================================================================
 
+# Threads used to unlink old temp files
+_UNLINK_WORKERS = 16
+
+
+def _unlink_file(file: Tuple[str, int]) -> Optional[int]:
+    """
+    Delete a file.
+
+    Args:
+        file: Path and size of the file
+
+    Returns:
+        Bytes freed, or None if the file could not be deleted
+    """
+    path, size = file
+    try:
+        os.unlink(path)
+    except OSError as e:
+        logger.warning("temp_file_delete_failed", path=path, error=str(e))
+        return None
+    return size
+
+
+def _iter_tree_bottom_up(path: str) -> Iterator[Tuple[os.DirEntry, bool]]:
+    """
+    Yield (entry, is_dir) for everything under path, children before parents.
+
+    Uses os.scandir so file types (and stat results, on most platforms)
+    come from the directory listing instead of extra syscalls per file.
+    Symlinks are yielded as files and never followed.
+
+    Args:
+        path: Directory to walk
+
+    Yields:
+        Directory entry and whether it is a real directory
+    """
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError as e:
+        logger.warning("temp_dir_scan_failed", path=path, error=str(e))
+        return
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _iter_tree_bottom_up(entry.path)
+            yield entry, True
+        else:
+            yield entry, False
+
+
+def _expired_size(entry: os.DirEntry, cutoff_ts: float) -> Optional[int]:
+    """
+    Size of a file last modified before cutoff_ts.
+
+    Args:
+        entry: Directory entry for the file
+        cutoff_ts: Modification time cutoff (epoch seconds)
+
+    Returns:
+        File size in bytes, or None if the file is newer or unreadable
+    """
+    try:
+        st = entry.stat()
+    except OSError as e:
+        logger.warning("temp_file_stat_failed", path=entry.path, error=str(e))
+        return None
+    return st.st_size if st.st_mtime < cutoff_ts else None
+
+
+def _scan_tree(
+    path: str,
+    cutoff_ts: float,
+    old_files: List[Tuple[str, int]],
+    directories: List[str],
+) -> bool:
+    """
+    Collect expired files and all directories under path, bottom-up.
+
+    Args:
+        path: Directory to scan
+        cutoff_ts: Modification time cutoff (epoch seconds)
+        old_files: Receives (path, size) of each expired file
+        directories: Receives each directory, children before parents
+
+    Returns:
+        True if every file under path is expired
+    """
+    all_expired = True
+    for entry, is_dir in _iter_tree_bottom_up(path):
+        if is_dir:
+            directories.append(entry.path)
+            continue
+        size = _expired_size(entry, cutoff_ts)
+        if size is None:
+            all_expired = False
+        else:
+            old_files.append((entry.path, size))
+    return all_expired
+
+
 @celery_app.task(
     bind=True,
     name="agent_service.workers.tasks.cleanup_tasks.cleanup_temp_files",
@@ -357,6 +548,7 @@ def cleanup_token_blacklist(self: Task) -> Dict[str, Any]:
     default_retry_delay=300,
     time_limit=600,  # 10 minutes
     soft_time_limit=540,
+    track_started=True,
 )
 def cleanup_temp_files(
     self: Task,
@@ -372,7 +564,7 @@ def cleanup_temp_files(
     3. Deletes old files and empty directories
     4. Returns cleanup statistics
 
-    Runs: Daily at 3 AM (configured in beat_schedule)
+    Runs: Daily at 3 AM (configured in workers/beat_schedule.py)
 
     Args:
         temp_dir: Directory to clean (default: /tmp/agent_service)
@@ -386,13 +578,13 @@ def cleanup_temp_files(
             - status: Task status
     """
     started_at = datetime.utcnow()
-    print(f"Starting temp file cleanup at {started_at}")
+    logger.info("temp_file_cleanup_started", temp_dir=temp_dir)
 
     try:
         temp_path = Path(temp_dir)
 
         if not temp_path.exists():
-            print(f"Temp directory {temp_dir} does not exist, nothing to clean")
+            logger.info("temp_file_cleanup_skipped", reason="directory_not_found", temp_dir=temp_dir)
             return {
                 "deleted_files": 0,
                 "deleted_dirs": 0,
@@ -404,38 +596,67 @@ def cleanup_temp_files(
             }
 
         cutoff_time = datetime.utcnow() - timedelta(hours=max_age_hours)
+        # Compare raw st_mtime floats rather than building a datetime per file
+        cutoff_ts = time.time() - max_age_hours * 3600
         deleted_files = 0
         deleted_dirs = 0
         freed_bytes = 0
 
-        # Walk through directory
-        for root, dirs, files in os.walk(temp_dir, topdown=False):
-            # Delete old files
-            for filename in files:
-                filepath = Path(root) / filename
-                try:
-                    file_mtime = datetime.fromtimestamp(filepath.stat().st_mtime)
-                    if file_mtime < cutoff_time:
-                        file_size = filepath.stat().st_size
-                        filepath.unlink()
+        # Walk bottom-up so directories are listed after their contents.
+        # Top-level subdirectories whose files have all expired (typically
+        # per-session dirs) are removed whole with rmtree; the rest are
+        # cleaned file by file.
+        old_files: List[Tuple[str, int]] = []
+        directories: List[str] = []
+        with os.scandir(temp_dir) as it:
+            top_entries = list(it)
+        for entry in top_entries:
+            if not entry.is_dir(follow_symlinks=False):
+                size = _expired_size(entry, cutoff_ts)
+                if size is not None:
+                    old_files.append((entry.path, size))
+                continue
+
+            subtree_files: List[Tuple[str, int]] = []
+            subtree_dirs: List[str] = []
+            if not _scan_tree(entry.path, cutoff_ts, subtree_files, subtree_dirs):
+                old_files.extend(subtree_files)
+                directories.extend(subtree_dirs)
+                directories.append(entry.path)
+                continue
+
+            shutil.rmtree(entry.path, ignore_errors=True)
+            if os.path.lexists(entry.path):
+                logger.warning("temp_dir_delete_failed", path=entry.path)
+                continue
+            deleted_files += len(subtree_files)
+            freed_bytes += sum(size for _, size in subtree_files)
+            deleted_dirs += len(subtree_dirs) + 1
+
+        # Delete old files in parallel; unlink releases the GIL, so the
+        # filesystem updates overlap instead of running one at a time
+        if old_files:
+            with ThreadPoolExecutor(max_workers=_UNLINK_WORKERS) as executor:
+                for freed in executor.map(_unlink_file, old_files):
+                    if freed is not None:
                         deleted_files += 1
-                        freed_bytes += file_size
-                        print(f"Deleted old file: {filepath}")
-                except Exception as e:
-                    print(f"Error deleting file {filepath}: {e}")
-
-            # Delete empty directories
-            for dirname in dirs:
-                dirpath = Path(root) / dirname
-                try:
-                    if not any(dirpath.iterdir()):  # Directory is empty
-                        dirpath.rmdir()
-                        deleted_dirs += 1
-                        print(f"Deleted empty directory: {dirpath}")
-                except Exception as e:
-                    print(f"Error deleting directory {dirpath}: {e}")
+                        freed_bytes += freed
 
-        print(f"Cleanup complete: deleted {deleted_files} files, {deleted_dirs} dirs, freed {freed_bytes} bytes")
+        # Delete empty directories, deepest first; rmdir refuses non-empty ones
+        for dirpath in directories:
+            try:
+                os.rmdir(dirpath)
+                deleted_dirs += 1
+            except OSError as e:
+                if e.errno not in (errno.ENOTEMPTY, errno.EEXIST):
+                    logger.warning("temp_dir_delete_failed", path=dirpath, error=str(e))
+
+        logger.info(
+            "temp_file_cleanup_completed",
+            deleted_files=deleted_files,
+            deleted_dirs=deleted_dirs,
+            freed_bytes=freed_bytes,
+        )
 
         return {
             "deleted_files": deleted_files,
@@ -451,7 +672,7 @@ def cleanup_temp_files(
         }
 
     except Exception as e:
-        print(f"Temp file cleanup failed: {e}")
+        logger.error("temp_file_cleanup_failed", error=str(e))
         raise self.retry(exc=e, countdown=self.default_retry_delay)
 
 
@@ -3,10 +3,13 @@ Tests for secrets management.
 """
 import json
 import os
+import shutil
+import sys
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, MagicMock
 
 from agent_service.config.secrets import (
+    AWSSecretsManagerProvider,
     EnvironmentSecretsProvider,
     SecretsManager,
     get_secrets_manager,
@@ -18,6 +21,40 @@ from agent_service.config.secrets import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _reset_secrets_singleton(monkeypatch):
+    """Start each test without a cached secrets manager."""
+    import agent_service.config.secrets as secrets_module
+
+    monkeypatch.setattr(secrets_module, "_secrets_manager_instance", None)
+
+
+@pytest.fixture
+def set_env(monkeypatch):
+    """Set several environment variables in one call."""
+    def _set(**variables: str) -> None:
+        for name, value in variables.items():
+            monkeypatch.setenv(name, value)
+
+    return _set
+
+
+@pytest.fixture(scope="session")
+def _env_file_template(tmp_path_factory):
+    """.env file written once per session and copied into each test."""
+    path = tmp_path_factory.mktemp("env_template") / ".env"
+    path.write_text("REFRESH_TEST=initial_value\n")
+    return path
+
+
+@pytest.fixture
+def env_file(_env_file_template, tmp_path):
+    """Per-test copy of the template .env file."""
+    path = tmp_path / ".env"
+    shutil.copyfile(_env_file_template, path)
+    return path
+
+
 # ============================================================================
 # Environment Provider Tests
 # ============================================================================
@@ -58,21 +95,18 @@ class TestEnvironmentSecretsProvider:
         value = provider.get_secret_json("INVALID_JSON")
         assert value is None
 
-    def test_list_secrets_no_prefix(self, monkeypatch):
+    def test_list_secrets_no_prefix(self, set_env):
         """Test listing all secrets."""
-        monkeypatch.setenv("KEY1", "value1")
-        monkeypatch.setenv("KEY2", "value2")
+        set_env(KEY1="value1", KEY2="value2")
         provider = EnvironmentSecretsProvider()
 
         secrets = provider.list_secrets()
         assert "KEY1" in secrets
         assert "KEY2" in secrets
 
-    def test_list_secrets_with_prefix(self, monkeypatch):
+    def test_list_secrets_with_prefix(self, set_env):
         """Test listing secrets with prefix filter."""
-        monkeypatch.setenv("APP_KEY1", "value1")
-        monkeypatch.setenv("APP_KEY2", "value2")
-        monkeypatch.setenv("OTHER_KEY", "value3")
+        set_env(APP_KEY1="value1", APP_KEY2="value2", OTHER_KEY="value3")
         provider = EnvironmentSecretsProvider()
 
         secrets = provider.list_secrets(prefix="APP_")
@@ -80,12 +114,8 @@ class TestEnvironmentSecretsProvider:
         assert "APP_KEY2" in secrets
         assert "OTHER_KEY" not in secrets
 
-    def test_refresh(self, monkeypatch, tmp_path):
+    def test_refresh(self, monkeypatch, env_file):
         """Test refreshing environment variables from .env file."""
-        # Create a temporary .env file
-        env_file = tmp_path / ".env"
-        env_file.write_text("REFRESH_TEST=initial_value\n")
-
         provider = EnvironmentSecretsProvider(dotenv_path=str(env_file))
 
         # Update the file
@@ -102,21 +132,33 @@ class TestEnvironmentSecretsProvider:
 # ============================================================================
 
 
+@pytest.fixture
+def mock_boto3(monkeypatch):
+    """Stand-in boto3 module picked up by the provider's lazy import."""
+    mock = MagicMock()
+    monkeypatch.setitem(sys.modules, "boto3", mock)
+    return mock
+
+
+@pytest.fixture(scope="module")
+def client_error():
+    """botocore's ClientError, imported once for the AWS tests."""
+    from botocore.exceptions import ClientError
+
+    return ClientError
+
+
 class TestAWSSecretsManagerProvider:
     """Tests for AWSSecretsManagerProvider."""
 
-    def test_init_without_boto3(self):
+    def test_init_without_boto3(self, monkeypatch):
         """Test initialization fails without boto3."""
-        with patch.dict("sys.modules", {"boto3": None}):
-            with pytest.raises(ImportError, match="boto3 is required"):
-                from agent_service.config.secrets import AWSSecretsManagerProvider
-                AWSSecretsManagerProvider()
+        monkeypatch.setitem(sys.modules, "boto3", None)
+        with pytest.raises(ImportError, match="boto3 is required"):
+            AWSSecretsManagerProvider()
 
-    @patch("agent_service.config.secrets.boto3")
     def test_init_with_boto3(self, mock_boto3):
         """Test successful initialization with boto3."""
-        from agent_service.config.secrets import AWSSecretsManagerProvider
-
         mock_client = Mock()
         mock_boto3.client.return_value = mock_client
 
@@ -126,11 +168,8 @@ class TestAWSSecretsManagerProvider:
         assert provider._cache_ttl == 1800
         mock_boto3.client.assert_called_once_with("secretsmanager", region_name="us-west-2")
 
-    @patch("agent_service.config.secrets.boto3")
     def test_get_secret_string(self, mock_boto3):
         """Test getting a string secret from AWS."""
-        from agent_service.config.secrets import AWSSecretsManagerProvider
-
         mock_client = Mock()
         mock_client.get_secret_value.return_value = {"SecretString": "secret_value"}
         mock_boto3.client.return_value = mock_client
@@ -141,11 +180,8 @@ class TestAWSSecretsManagerProvider:
         assert value == "secret_value"
         mock_client.get_secret_value.assert_called_once_with(SecretId="my-secret")
 
-    @patch("agent_service.config.secrets.boto3")
     def test_get_secret_binary(self, mock_boto3):
         """Test getting a binary secret from AWS."""
-        from agent_service.config.secrets import AWSSecretsManagerProvider
-
         mock_client = Mock()
         mock_client.get_secret_value.return_value = {
             "SecretBinary": b"secret_value"
@@ -157,14 +193,10 @@ class TestAWSSecretsManagerProvider:
 
         assert value == "secret_value"
 
-    @patch("agent_service.config.secrets.boto3")
-    def test_get_secret_not_found(self, mock_boto3):
+    def test_get_secret_not_found(self, mock_boto3, client_error):
         """Test getting a non-existent secret from AWS."""
-        from agent_service.config.secrets import AWSSecretsManagerProvider
-        from botocore.exceptions import ClientError
-
         mock_client = Mock()
-        mock_client.get_secret_value.side_effect = ClientError(
+        mock_client.get_secret_value.side_effect = client_error(
             {"Error": {"Code": "ResourceNotFoundException"}},
             "GetSecretValue"
         )
@@ -175,11 +207,8 @@ class TestAWSSecretsManagerProvider:
 
         assert value is None
 
-    @patch("agent_service.config.secrets.boto3")
     def test_get_secret_cache(self, mock_boto3):
         """Test secret caching."""
-        from agent_service.config.secrets import AWSSecretsManagerProvider
-
         mock_client = Mock()
         mock_client.get_secret_value.return_value = {"SecretString": "cached_value"}
         mock_boto3.client.return_value = mock_client
@@ -196,11 +225,8 @@ class TestAWSSecretsManagerProvider:
         assert value2 == "cached_value"
         assert mock_client.get_secret_value.call_count == 1  # No additional call
 
-    @patch("agent_service.config.secrets.boto3")
     def test_list_secrets(self, mock_boto3):
         """Test listing secrets from AWS."""
-        from agent_service.config.secrets import AWSSecretsManagerProvider
-
         mock_client = Mock()
         mock_paginator = Mock()
         mock_paginator.paginate.return_value = [
@@ -220,11 +246,8 @@ class TestAWSSecretsManagerProvider:
         assert "app/secret1" in secrets
         assert "app/secret2" in secrets
 
-    @patch("agent_service.config.secrets.boto3")
     def test_refresh_clears_cache(self, mock_boto3):
         """Test refresh clears the cache."""
-        from agent_service.config.secrets import AWSSecretsManagerProvider
-
         mock_client = Mock()
         mock_boto3.client.return_value = mock_client
 
@@ -244,13 +267,16 @@ class TestAWSSecretsManagerProvider:
 class TestSecretsManager:
     """Tests for SecretsManager."""
 
-    def test_init_env_provider(self, monkeypatch):
+    @pytest.fixture
+    def env_manager(self):
+        """Secrets manager backed by environment variables."""
+        return SecretsManager(provider="env")
+
+    def test_init_env_provider(self, env_manager):
         """Test initialization with environment provider."""
-        manager = SecretsManager(provider="env")
-        assert len(manager._providers) == 1
-        assert isinstance(manager._providers[0], EnvironmentSecretsProvider)
+        assert len(env_manager._providers) == 1
+        assert isinstance(env_manager._providers[0], EnvironmentSecretsProvider)
 
-    @patch("agent_service.config.secrets.boto3")
     def test_init_aws_provider(self, mock_boto3):
         """Test initialization with AWS provider."""
         mock_boto3.client.return_value = Mock()
@@ -260,39 +286,74 @@ class TestSecretsManager:
         # Should have AWS provider + env fallback
         assert len(manager._providers) >= 1
 
-    def test_get_secret_from_provider(self, monkeypatch):
+    def test_get_secret_from_provider(self, env_manager, monkeypatch):
         """Test getting secret from provider chain."""
         monkeypatch.setenv("TEST_SECRET", "test_value")
 
-        manager = SecretsManager(provider="env")
-        value = manager.get_secret("TEST_SECRET")
+        value = env_manager.get_secret("TEST_SECRET")
 
         assert value == "test_value"
 
-    def test_get_secret_not_found(self):
+    def test_get_secret_not_found(self, env_manager):
         """Test getting non-existent secret."""
-        manager = SecretsManager(provider="env")
-        value = manager.get_secret("NONEXISTENT")
+        value = env_manager.get_secret("NONEXISTENT")
 
         assert value is None
 
-    def test_get_secret_json(self, monkeypatch):
+    def test_get_secret_json(self, env_manager, monkeypatch):
         """Test getting JSON secret."""
         json_data = {"key": "value"}
         monkeypatch.setenv("JSON_SECRET", json.dumps(json_data))
 
-        manager = SecretsManager(provider="env")
-        value = manager.get_secret_json("JSON_SECRET")
+        value = env_manager.get_secret_json("JSON_SECRET")
 
         assert value == json_data
 
-    def test_list_secrets(self, monkeypatch):
+    def test_env_secrets_not_cached(self, env_manager, set_env):
+        """Test environment changes are visible without a refresh."""
+        set_env(ENV_SECRET="first", ENV_JSON=json.dumps({"v": 1}))
+
+        assert env_manager.get_secret("ENV_SECRET") == "first"
+        assert env_manager.get_secret_json("ENV_JSON") == {"v": 1}
+
+        set_env(ENV_SECRET="second", ENV_JSON=json.dumps({"v": 2}))
+        assert env_manager.get_secret("ENV_SECRET") == "second"
+        assert env_manager.get_secret_json("ENV_JSON") == {"v": 2}
+
+    def test_aws_secrets_cached_until_refresh(self, mock_boto3):
+        """Test secrets found in AWS are cached until refresh."""
+        mock_client = Mock()
+        mock_client.get_secret_value.return_value = {"SecretString": "aws_value"}
+        mock_boto3.client.return_value = mock_client
+        manager = SecretsManager(provider="aws", aws_region="us-east-1")
+
+        assert manager.get_secret("AWS_SECRET") == "aws_value"
+        assert manager.get_secret("AWS_SECRET") == "aws_value"
+        assert mock_client.get_secret_value.call_count == 1
+
+        manager.refresh()
+        assert manager.get_secret("AWS_SECRET") == "aws_value"
+        assert mock_client.get_secret_value.call_count == 2
+
+    def test_cached_json_secret_returned_as_copy(self, mock_boto3):
+        """Test callers can't modify a cached JSON secret."""
+        mock_client = Mock()
+        mock_client.get_secret_value.return_value = {
+            "SecretString": json.dumps({"db": {"user": "admin"}})
+        }
+        mock_boto3.client.return_value = mock_client
+        manager = SecretsManager(provider="aws", aws_region="us-east-1")
+
+        first = manager.get_secret_json("AWS_JSON")
+        first["db"]["user"] = "changed"
+
+        assert manager.get_secret_json("AWS_JSON") == {"db": {"user": "admin"}}
+
+    def test_list_secrets(self, env_manager, set_env):
         """Test listing secrets."""
-        monkeypatch.setenv("APP_KEY1", "value1")
-        monkeypatch.setenv("APP_KEY2", "value2")
+        set_env(APP_KEY1="value1", APP_KEY2="value2")
 
-        manager = SecretsManager(provider="env")
-        secrets = manager.list_secrets(prefix="APP_")
+        secrets = env_manager.list_secrets(prefix="APP_")
 
         assert "APP_KEY1" in secrets
         assert "APP_KEY2" in secrets
@@ -306,10 +367,13 @@ class TestSecretsManager:
 class TestSecretMasking:
     """Tests for secret masking functions."""
 
-    def test_mask_secret(self):
+    @pytest.mark.parametrize("value,expected", [
+        ("my-secret-key", "****"),
+        ("", ""),
+    ])
+    def test_mask_secret(self, value, expected):
         """Test masking a single secret."""
-        assert mask_secret("my-secret-key") == "****"
-        assert mask_secret("") == ""
+        assert mask_secret(value) == expected
 
     def test_mask_secrets_in_dict_basic(self):
         """Test masking secrets in a simple dictionary."""
@@ -370,19 +434,24 @@ class TestSecretMasking:
         assert masked["custom_secret"] == "****"  # Masked (custom key)
         assert masked["normal_field"] == "should_not_mask"
 
-    def test_mask_secrets_case_insensitive(self):
+    @pytest.mark.parametrize("key", ["PASSWORD", "Password", "password"])
+    def test_mask_secrets_case_insensitive(self, key):
         """Test masking is case-insensitive."""
-        data = {
-            "PASSWORD": "secret1",
-            "Password": "secret2",
-            "password": "secret3"
-        }
+        masked = mask_secrets_in_dict({key: "secret"})
 
-        masked = mask_secrets_in_dict(data)
+        assert masked[key] == "****"
 
-        assert masked["PASSWORD"] == "****"
-        assert masked["Password"] == "****"
-        assert masked["password"] == "****"
+    def test_mask_secrets_inplace_copies_nested(self):
+        """Test in-place masking leaves nested caller data untouched."""
+        credentials = {"password": "secret123"}
+        data = {"token": "abc", "credentials_ref": credentials}
+
+        masked = mask_secrets_in_dict(data, inplace=True)
+
+        assert masked is data
+        assert data["token"] == "****"
+        assert data["credentials_ref"]["password"] == "****"
+        assert credentials["password"] == "secret123"
 
     def test_mask_secrets_processor(self):
         """Test structlog processor integration."""
@@ -395,6 +464,7 @@ class TestSecretMasking:
 
         masked = mask_secrets_processor(None, None, event_dict)
 
+        assert masked is event_dict
         assert masked["message"] == "User logged in"
         assert masked["username"] == "john"
         assert masked["password"] == "****"
@@ -413,18 +483,11 @@ class TestConvenienceFunctions:
         """Test get_secret convenience function."""
         monkeypatch.setenv("TEST_KEY", "test_value")
 
-        # Need to reset the singleton
-        import agent_service.config.secrets as secrets_module
-        secrets_module._secrets_manager_instance = None
-
         value = get_secret("TEST_KEY")
         assert value == "test_value"
 
     def test_get_secret_with_default(self):
         """Test get_secret with default value."""
-        import agent_service.config.secrets as secrets_module
-        secrets_module._secrets_manager_instance = None
-
         value = get_secret("NONEXISTENT_KEY", default="default_value")
         assert value == "default_value"
 
@@ -433,17 +496,11 @@ class TestConvenienceFunctions:
         json_data = {"key": "value"}
         monkeypatch.setenv("JSON_KEY", json.dumps(json_data))
 
-        import agent_service.config.secrets as secrets_module
-        secrets_module._secrets_manager_instance = None
-
         value = get_secret_json("JSON_KEY")
         assert value == json_data
 
     def test_get_secret_json_with_default(self):
         """Test get_secret_json with default value."""
-        import agent_service.config.secrets as secrets_module
-        secrets_module._secrets_manager_instance = None
-
         default = {"default": "value"}
         value = get_secret_json("NONEXISTENT_KEY", default=default)
         assert value == default
@@ -459,9 +516,6 @@ class TestSecretsIntegration:
 
     def test_singleton_pattern(self, monkeypatch):
         """Test that get_secrets_manager returns singleton."""
-        import agent_service.config.secrets as secrets_module
-        secrets_module._secrets_manager_instance = None
-
         manager1 = get_secrets_manager()
         manager2 = get_secrets_manager()
 
@@ -469,9 +523,6 @@ class TestSecretsIntegration:
 
     def test_force_reload(self, monkeypatch):
         """Test force_reload creates new instance."""
-        import agent_service.config.secrets as secrets_module
-        secrets_module._secrets_manager_instance = None
-
         manager1 = get_secrets_manager()
         manager2 = get_secrets_manager(force_reload=True)
 
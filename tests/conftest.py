@@ -13,20 +13,36 @@ This module provides:
 """
 
 import asyncio
-from typing import AsyncGenerator, Generator
+import os
+from types import MappingProxyType
+from typing import Any, AsyncGenerator, Mapping
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi import FastAPI
-from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.pool import NullPool
+from httpx import ASGITransport, AsyncClient
+from pydantic import SecretStr
+from sqlalchemy import event, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import NullPool, StaticPool
 from sqlmodel import SQLModel
 
 from agent_service.api.app import create_app
 from agent_service.config.settings import Settings, get_settings
 from agent_service.infrastructure.database.connection import DatabaseManager
 
+try:
+    import uvloop  # Installed with uvicorn[standard], except on Windows
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 
 # ============================================================================
 # Pytest Configuration
@@ -35,17 +51,61 @@ from agent_service.infrastructure.database.connection import DatabaseManager
 pytest_plugins = ["tests.factories.fixtures"]
 
 
+_TEST_SETTINGS_KEY = pytest.StashKey[Settings]()
+_TEST_ENGINE_KEY = pytest.StashKey[AsyncEngine]()
+_WORKER_DATABASE_KEY = pytest.StashKey[str]()
+_FRESH_DATABASE_KEY = pytest.StashKey[bool]()
+
+
 def pytest_configure(config):
     """Configure pytest-asyncio to use auto mode."""
     config.option.asyncio_mode = "auto"
 
 
+def pytest_sessionstart(session):
+    """
+    Build test settings and the database engine before collection.
+
+    Creating an engine does not connect, so no event loop is needed here.
+    The schema is created later on the shared test connection, inside the
+    session's loop.
+
+    Under pytest-xdist each worker gets its own server database; in-memory
+    SQLite is already private to the worker process.
+    """
+    settings = _build_test_settings()
+    database_url = settings.database_url.get_secret_value()
+
+    # In-memory SQLite starts out empty; so does a per-worker database
+    fresh_database = database_url.startswith("sqlite") and ":memory:" in database_url
+
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker_id and not database_url.startswith("sqlite"):
+        database_url = _worker_database_url(database_url, worker_id)
+        asyncio.run(_create_database(database_url))
+        session.config.stash[_WORKER_DATABASE_KEY] = database_url
+        fresh_database = True
+        settings = settings.model_copy(
+            update={"database_url": SecretStr(database_url)}
+        )
+
+    session.config.stash[_TEST_SETTINGS_KEY] = settings
+    session.config.stash[_FRESH_DATABASE_KEY] = fresh_database
+    session.config.stash[_TEST_ENGINE_KEY] = _build_test_engine(database_url)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Drop this worker's database, if one was created."""
+    database_url = session.config.stash.get(_WORKER_DATABASE_KEY, None)
+    if database_url:
+        asyncio.run(_drop_database(database_url))
+
+
 # ============================================================================
 # Settings and Configuration
 # ============================================================================
 
-@pytest.fixture(scope="session")
-def test_settings() -> Settings:
+def _build_test_settings() -> Settings:
     """
     Test settings with overrides for test environment.
 
@@ -73,6 +133,12 @@ def test_settings() -> Settings:
     )
 
 
+@pytest.fixture(scope="session")
+def test_settings(pytestconfig: pytest.Config) -> Settings:
+    """Test settings built once in pytest_sessionstart."""
+    return pytestconfig.stash[_TEST_SETTINGS_KEY]
+
+
 @pytest.fixture(scope="session", autouse=True)
 def override_settings(test_settings: Settings):
     """
@@ -103,66 +169,167 @@ def override_settings(test_settings: Settings):
 # ============================================================================
 
 @pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
     """
-    Create an event loop for the test session.
+    Event loop policy used by pytest-asyncio for all async tests.
 
-    This ensures all async tests share the same event loop,
-    which is required for session-scoped async fixtures.
+    Uses uvloop when it is installed, the stdlib policy otherwise.
     """
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+    if UVLOOP_AVAILABLE:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
 
 
 # ============================================================================
 # Database Fixtures
 # ============================================================================
 
-@pytest.fixture(scope="session")
-async def test_engine(test_settings: Settings):
+def _enable_sqlite_savepoints(engine: AsyncEngine) -> None:
     """
-    Create test database engine.
+    Let SQLAlchemy manage transactions on pysqlite connections.
 
-    Uses NullPool to prevent connection pooling issues in tests.
-    Creates all tables at session start and drops them at session end.
+    The driver's implicit BEGIN handling breaks SAVEPOINT, so it is
+    switched off and BEGIN is emitted explicitly instead.
     """
-    engine = create_async_engine(
-        test_settings.database_url.get_secret_value(),
-        poolclass=NullPool,  # Disable pooling for tests
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _on_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+
+def _build_test_engine(database_url: str) -> AsyncEngine:
+    """
+    Create test database engine.
+
+    Tests share a single connection through the _connection fixture, so
+    the suite pays one connect instead of one per test. The default
+    in-memory SQLite database uses StaticPool; set a PostgreSQL URL in
+    test settings to run against a real server.
+    """
+    if database_url.startswith("sqlite"):
+        # In-memory SQLite: StaticPool keeps every checkout on the same
+        # connection, otherwise each one would see its own empty database
+        engine = create_async_engine(
+            database_url,
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+            echo=False,  # Set to True for SQL debugging
+        )
+        _enable_sqlite_savepoints(engine)
+        return engine
+
+    return create_async_engine(
+        database_url,
         echo=False,  # Set to True for SQL debugging
     )
 
-    # Create all tables
-    async with engine.begin() as conn:
-        await conn.run_sync(SQLModel.metadata.create_all)
 
-    yield engine
+def _worker_database_url(database_url: str, worker_id: str) -> str:
+    """Suffix the database name with the xdist worker id (e.g. test_db_gw0)."""
+    url = make_url(database_url)
+    return url.set(database=f"{url.database}_{worker_id}").render_as_string(
+        hide_password=False
+    )
+
+
+async def _execute_on_server(database_url: str, statement: str) -> None:
+    """Run a statement outside a transaction on the server's postgres database."""
+    engine = create_async_engine(
+        make_url(database_url).set(database="postgres"),
+        poolclass=NullPool,
+        isolation_level="AUTOCOMMIT",
+    )
+    try:
+        async with engine.connect() as conn:
+            await conn.exec_driver_sql(statement)
+    finally:
+        await engine.dispose()
+
 
-    # Drop all tables after tests
-    async with engine.begin() as conn:
-        await conn.run_sync(SQLModel.metadata.drop_all)
+async def _create_database(database_url: str) -> None:
+    """(Re)create an empty database, dropping leftovers from an aborted run."""
+    name = make_url(database_url).database
+    await _execute_on_server(database_url, f'DROP DATABASE IF EXISTS "{name}"')
+    await _execute_on_server(database_url, f'CREATE DATABASE "{name}"')
+
+
+async def _drop_database(database_url: str) -> None:
+    """Drop a database created by _create_database."""
+    name = make_url(database_url).database
+    await _execute_on_server(database_url, f'DROP DATABASE IF EXISTS "{name}"')
+
+
+@pytest.fixture(scope="session")
+async def test_engine(pytestconfig: pytest.Config) -> AsyncGenerator[AsyncEngine, None]:
+    """
+    Test database engine built in pytest_sessionstart.
+
+    Disposed here rather than in pytest_sessionfinish because pooled
+    async connections must be closed on the loop that opened them.
+    """
+    engine = pytestconfig.stash[_TEST_ENGINE_KEY]
+
+    yield engine
 
     await engine.dispose()
 
 
 @pytest.fixture(scope="session")
-async def test_session_factory(test_engine):
-    """Create session factory for tests."""
+async def _connection(
+    pytestconfig: pytest.Config,
+    test_engine,
+) -> AsyncGenerator[AsyncConnection, None]:
+    """
+    Shared connection wrapped in an outer transaction for the whole session.
+
+    Tables are created inside the transaction, so rolling it back at the
+    end of the session also removes the schema. On a database known to be
+    empty the per-table existence checks are skipped.
+    """
+    connection = await test_engine.connect()
+    trans = await connection.begin()
+    await connection.run_sync(
+        SQLModel.metadata.create_all,
+        checkfirst=not pytestconfig.stash[_FRESH_DATABASE_KEY],
+    )
+
+    yield connection
+
+    await trans.rollback()
+    await connection.close()
+
+
+@pytest.fixture(scope="session")
+async def test_session_factory(_connection: AsyncConnection):
+    """
+    Create session factory for tests.
+
+    Sessions join the shared connection's transaction through their own
+    SAVEPOINT, so commit() in a test only releases that savepoint.
+    """
     return async_sessionmaker(
-        test_engine,
+        bind=_connection,
         class_=AsyncSession,
         expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
     )
 
 
 @pytest.fixture
-async def db_session(test_session_factory) -> AsyncGenerator[AsyncSession, None]:
+async def db_session(
+    _connection: AsyncConnection,
+    test_session_factory,
+) -> AsyncGenerator[AsyncSession, None]:
     """
     Provide a database session with automatic rollback.
 
-    Each test gets a fresh transaction that is rolled back after the test,
-    ensuring test isolation and database cleanliness.
+    Each test runs inside a SAVEPOINT on the shared connection that is
+    rolled back after the test, ensuring test isolation and database
+    cleanliness.
 
     Usage:
         async def test_something(db_session):
@@ -171,15 +338,21 @@ async def db_session(test_session_factory) -> AsyncGenerator[AsyncSession, None]
             await db_session.commit()
             # ... test logic ...
     """
-    async with test_session_factory() as session:
-        # Begin a nested transaction
-        async with session.begin():
+    savepoint = await _connection.begin_nested()
+    try:
+        async with test_session_factory() as session:
             yield session
-            # Rollback happens automatically at context exit
+    finally:
+        # Undo everything the test wrote, including committed work
+        await savepoint.rollback()
 
 
 @pytest.fixture
-async def db_manager(test_settings: Settings, test_engine) -> AsyncGenerator[DatabaseManager, None]:
+async def db_manager(
+    test_settings: Settings,
+    test_engine,
+    test_session_factory,
+) -> AsyncGenerator[DatabaseManager, None]:
     """
     Provide a configured DatabaseManager instance for tests.
 
@@ -187,11 +360,7 @@ async def db_manager(test_settings: Settings, test_engine) -> AsyncGenerator[Dat
     """
     manager = DatabaseManager()
     manager._engine = test_engine
-    manager._session_factory = async_sessionmaker(
-        test_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
+    manager._session_factory = test_session_factory
 
     yield manager
 
@@ -202,19 +371,47 @@ async def db_manager(test_settings: Settings, test_engine) -> AsyncGenerator[Dat
 # Redis Fixtures
 # ============================================================================
 
+@pytest.fixture(scope="module")
+async def _fake_redis():
+    """In-memory Redis shared by the tests of one module."""
+    from fakeredis import FakeAsyncRedis
+
+    client = FakeAsyncRedis(decode_responses=True)
+    yield client
+    await client.aclose()
+
+
 @pytest.fixture
-def mock_redis() -> MagicMock:
+async def mock_redis(_fake_redis):
     """
-    Mock Redis client for tests that don't need real Redis.
+    In-memory Redis client for tests that don't need real Redis.
 
-    Provides basic Redis operations as mocks.
+    Backed by fakeredis, so commands behave like a real server. The
+    database is flushed after each test.
 
     Usage:
-        def test_cache(mock_redis):
-            mock_redis.get.return_value = b"cached_value"
+        async def test_cache(mock_redis):
+            await mock_redis.set("key", "cached_value")
             result = await my_cache_function()
             assert result == "cached_value"
     """
+    yield _fake_redis
+    await _fake_redis.flushdb()
+
+
+@pytest.fixture
+def mock_redis_calls() -> MagicMock:
+    """
+    Mock Redis client for tests that assert on calls.
+
+    Provides basic Redis operations as mocks.
+
+    Usage:
+        async def test_cache(mock_redis_calls):
+            mock_redis_calls.get.return_value = b"cached_value"
+            result = await my_cache_function()
+            mock_redis_calls.get.assert_called_once()
+    """
     redis = MagicMock()
     redis.get = AsyncMock(return_value=None)
     redis.set = AsyncMock(return_value=True)
@@ -226,68 +423,88 @@ def mock_redis() -> MagicMock:
     return redis
 
 
+@pytest.fixture(scope="session")
+async def _redis_connection(test_settings: Settings):
+    """Real Redis client shared by the whole session."""
+    if not test_settings.redis_url:
+        pytest.skip("Redis not configured for tests")
+
+    import redis.asyncio as aioredis
+
+    client = aioredis.from_url(
+        test_settings.redis_url.get_secret_value(),
+        decode_responses=True,
+    )
+    try:
+        await client.ping()
+    except Exception:
+        await client.aclose()
+        pytest.skip("Redis not available, skipping test")
+
+    yield client
+
+    await client.aclose()
+
+
 @pytest.fixture
-async def redis_client(test_settings: Settings):
+async def redis_client(_redis_connection):
     """
     Real Redis client for integration tests.
 
     If redis_url is configured in test settings, this will connect to real Redis.
-    Otherwise, returns a mock.
+    Otherwise, the test is skipped. The connection is opened once per
+    session and the database is flushed after each test.
 
     For real Redis tests, set REDIS_URL env var:
         REDIS_URL=redis://localhost:6379/15 pytest
     """
-    if test_settings.redis_url:
-        try:
-            import redis.asyncio as aioredis
-            client = await aioredis.from_url(
-                test_settings.redis_url.get_secret_value(),
-                decode_responses=True,
-            )
-            await client.ping()
-            yield client
-            await client.flushdb()  # Clean up after tests
-            await client.close()
-        except Exception:
-            # Fall back to mock if Redis is unavailable
-            pytest.skip("Redis not available, skipping test")
-    else:
-        # Return mock if no Redis configured
-        pytest.skip("Redis not configured for tests")
+    yield _redis_connection
+    await _redis_connection.flushdb()  # Clean up after each test
 
 
 # ============================================================================
 # FastAPI Application and Client
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def app(test_settings: Settings) -> FastAPI:
     """
     Create FastAPI application for testing.
 
-    This creates a fresh app instance with test configuration.
+    The app is built once per session with test configuration; building
+    the router and middleware stack per test is the slowest part of
+    client setup.
     """
     return create_app()
 
 
+@pytest.fixture(scope="session")
+def asgi_transport(app: FastAPI) -> ASGITransport:
+    """ASGI transport to the test app, shared by every test client."""
+    return ASGITransport(app=app)
+
+
 @pytest.fixture
-async def async_client(app: FastAPI) -> AsyncGenerator[AsyncClient, None]:
+async def async_client(asgi_transport: ASGITransport) -> AsyncGenerator[AsyncClient, None]:
     """
     Async HTTP client for testing FastAPI endpoints.
 
+    Each test gets its own client, so headers and cookies don't leak
+    between tests; the app and transport are reused.
+
     Usage:
         async def test_endpoint(async_client):
             response = await async_client.get("/api/v1/users")
             assert response.status_code == 200
     """
-    async with AsyncClient(app=app, base_url="http://test") as client:
+    async with AsyncClient(transport=asgi_transport, base_url="http://test") as client:
         yield client
 
 
 @pytest.fixture
 async def authenticated_client(
     async_client: AsyncClient,
-    mock_user: dict,
+    auth_headers: Mapping[str, str],
 ) -> AsyncClient:
     """
     Authenticated HTTP client with mock user token.
@@ -300,9 +517,7 @@ async def authenticated_client(
             assert response.status_code == 200
     """
     # Add authentication header
-    async_client.headers.update({
-        "Authorization": f"Bearer {mock_user['token']}"
-    })
+    async_client.headers.update(auth_headers)
     return async_client
 
 
@@ -310,39 +525,55 @@ async def authenticated_client(
 # Authentication Fixtures
 # ============================================================================
 
-@pytest.fixture
-def mock_user() -> dict:
+# Read-only test data, built once at import time
+_MOCK_USER: Mapping[str, Any] = MappingProxyType({
+    "id": "test-user-id-123",
+    "email": "test@example.com",
+    "username": "testuser",
+    "is_active": True,
+    "is_superuser": False,
+    "token": "mock-jwt-token-for-testing",
+    "roles": ["user"],
+})
+
+_MOCK_ADMIN_USER: Mapping[str, Any] = MappingProxyType({
+    "id": "admin-user-id-456",
+    "email": "admin@example.com",
+    "username": "adminuser",
+    "is_active": True,
+    "is_superuser": True,
+    "token": "mock-admin-jwt-token",
+    "roles": ["user", "admin"],
+})
+
+_MOCK_API_KEY = "test-api-key-12345"
+
+_AUTH_HEADERS: Mapping[str, str] = MappingProxyType({
+    "Authorization": f"Bearer {_MOCK_USER['token']}"
+})
+
+_API_KEY_HEADERS: Mapping[str, str] = MappingProxyType({
+    "X-API-Key": _MOCK_API_KEY
+})
+
+
+@pytest.fixture(scope="session")
+def mock_user() -> Mapping[str, Any]:
     """
     Mock user data for authentication tests.
 
-    Returns a dictionary with user information and a mock JWT token.
+    Returns a read-only mapping with user information and a mock JWT token.
     """
-    return {
-        "id": "test-user-id-123",
-        "email": "test@example.com",
-        "username": "testuser",
-        "is_active": True,
-        "is_superuser": False,
-        "token": "mock-jwt-token-for-testing",
-        "roles": ["user"],
-    }
+    return _MOCK_USER
 
 
-@pytest.fixture
-def mock_admin_user() -> dict:
+@pytest.fixture(scope="session")
+def mock_admin_user() -> Mapping[str, Any]:
     """Mock admin user data for authorization tests."""
-    return {
-        "id": "admin-user-id-456",
-        "email": "admin@example.com",
-        "username": "adminuser",
-        "is_active": True,
-        "is_superuser": True,
-        "token": "mock-admin-jwt-token",
-        "roles": ["user", "admin"],
-    }
+    return _MOCK_ADMIN_USER
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_api_key() -> str:
     """
     Mock API key for API key authentication tests.
@@ -354,11 +585,11 @@ def mock_api_key() -> str:
                 headers={"X-API-Key": mock_api_key}
             )
     """
-    return "test-api-key-12345"
+    return _MOCK_API_KEY
 
 
-@pytest.fixture
-def auth_headers(mock_user: dict) -> dict:
+@pytest.fixture(scope="session")
+def auth_headers() -> Mapping[str, str]:
     """
     Authentication headers for manual request building.
 
@@ -369,45 +600,29 @@ def auth_headers(mock_user: dict) -> dict:
                 headers=auth_headers
             )
     """
-    return {
-        "Authorization": f"Bearer {mock_user['token']}"
-    }
+    return _AUTH_HEADERS
 
 
-@pytest.fixture
-def api_key_headers(mock_api_key: str) -> dict:
+@pytest.fixture(scope="session")
+def api_key_headers() -> Mapping[str, str]:
     """API key headers for manual request building."""
-    return {
-        "X-API-Key": mock_api_key
-    }
+    return _API_KEY_HEADERS
 
 
 # ============================================================================
 # Utility Fixtures
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def anyio_backend():
     """
     Configure anyio backend for async tests.
 
+    Session-scoped so session-scoped async fixtures can use it.
+    Runs asyncio on uvloop when it is installed.
     Required by some async testing libraries.
     """
+    if UVLOOP_AVAILABLE:
+        return ("asyncio", {"use_uvloop": True})
     return "asyncio"
 
-
-# ============================================================================
-# Cleanup and Teardown
-# ============================================================================
-
-@pytest.fixture(autouse=True)
-async def cleanup_after_test():
-    """
-    Automatic cleanup after each test.
-
-    Add any global cleanup logic here that should run after every test.
-    """
-    yield
-    # Cleanup code here (runs after each test)
-    # Example: clear caches, reset singletons, etc.
-    pass
@@ -253,14 +253,14 @@ class TestProtocolWorkflows:
                 parameters={"type": "object"}
             )
 
-            with patch("agent_service.api.routes.protocols.tool_registry.list_tools", return_value=[mock_tool.schema]):
+            with patch("agent_service.tools.registry.tool_registry.list_tools", return_value=[mock_tool.schema]):
                 tools_response = await async_client.get("/api/v1/protocols/mcp/tools")
 
         assert tools_response.status_code == 200
 
         # Step 2: Execute tool
         with patch("agent_service.api.routes.protocols.protocol_registry.is_registered", return_value=True):
-            with patch("agent_service.api.routes.protocols.tool_registry.execute", return_value={"result": "success"}):
+            with patch("agent_service.tools.registry.tool_registry.execute", return_value={"result": "success"}):
                 exec_response = await async_client.post(
                     "/api/v1/protocols/mcp/tools/mcp_workflow_tool",
                     json={"arguments": {}}
@@ -64,7 +64,7 @@ class TestMCPProtocolIntegration:
     async def test_mcp_direct_tool_execution(self, async_client: AsyncClient):
         """Test direct tool execution via MCP."""
         with patch("agent_service.api.routes.protocols.protocol_registry.is_registered", return_value=True):
-            with patch("agent_service.api.routes.protocols.tool_registry.execute") as mock_execute:
+            with patch("agent_service.tools.registry.tool_registry.execute") as mock_execute:
                 mock_execute.return_value = {"status": "success", "data": "tool result"}
 
                 response = await async_client.post(
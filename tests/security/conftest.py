@@ -14,8 +14,7 @@ from typing import AsyncGenerator
 from unittest.mock import AsyncMock, MagicMock, patch
 import jwt
 
-from httpx import AsyncClient
-from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
 
 from agent_service.auth.schemas import UserInfo, AuthProvider
 
@@ -191,68 +190,70 @@ def mock_api_key_user() -> UserInfo:
 
 
 @pytest.fixture
-async def unauthenticated_client(app: FastAPI) -> AsyncGenerator[AsyncClient, None]:
+async def unauthenticated_client(
+    asgi_transport: ASGITransport,
+) -> AsyncGenerator[AsyncClient, None]:
     """
     HTTP client without authentication headers.
 
     Use this to test that endpoints properly reject unauthenticated requests.
     """
-    async with AsyncClient(app=app, base_url="http://test") as client:
+    async with AsyncClient(transport=asgi_transport, base_url="http://test") as client:
         yield client
 
 
 @pytest.fixture
 async def authenticated_client(
-    app: FastAPI, valid_jwt_token: str
+    asgi_transport: ASGITransport, valid_jwt_token: str
 ) -> AsyncGenerator[AsyncClient, None]:
     """
     HTTP client with valid JWT authentication.
 
     Use this to test authenticated access to protected endpoints.
     """
-    async with AsyncClient(app=app, base_url="http://test") as client:
+    async with AsyncClient(transport=asgi_transport, base_url="http://test") as client:
         client.headers.update({"Authorization": f"Bearer {valid_jwt_token}"})
         yield client
 
 
 @pytest.fixture
 async def admin_client(
-    app: FastAPI, admin_jwt_token: str
+    asgi_transport: ASGITransport, admin_jwt_token: str
 ) -> AsyncGenerator[AsyncClient, None]:
     """
     HTTP client authenticated as admin user.
 
     Use this to test admin-only endpoints.
     """
-    async with AsyncClient(app=app, base_url="http://test") as client:
+    async with AsyncClient(transport=asgi_transport, base_url="http://test") as client:
         client.headers.update({"Authorization": f"Bearer {admin_jwt_token}"})
         yield client
 
 
 @pytest.fixture
 async def api_key_client(
-    app: FastAPI, valid_api_key: str
+    asgi_transport: ASGITransport, valid_api_key: str
 ) -> AsyncGenerator[AsyncClient, None]:
     """
     HTTP client authenticated with API key.
 
     Use this to test API key authentication.
     """
-    async with AsyncClient(app=app, base_url="http://test") as client:
+    async with AsyncClient(transport=asgi_transport, base_url="http://test") as client:
         client.headers.update({"X-API-Key": valid_api_key})
         yield client
 
 
 @pytest.fixture
 async def expired_token_client(
-    app: FastAPI, expired_jwt_token: str
+    asgi_transport: ASGITransport, expired_jwt_token: str
 ) -> AsyncGenerator[AsyncClient, None]:
     """
     HTTP client with expired JWT token.
 
     Use this to test that expired tokens are rejected.
     """
-    async with AsyncClient(app=app, base_url="http://test") as client:
+    async with AsyncClient(transport=asgi_transport, base_url="http://test") as client:
         client.headers.update({"Authorization": f"Bearer {expired_jwt_token}"})
         yield client
 
@@ -5,7 +5,7 @@ import pytest
 from unittest.mock import AsyncMock, Mock, patch
 
 from agent_service.interfaces import AgentInput, AgentOutput, StreamChunk, IAgent
-from agent_service.agent.registry import AgentRegistry
+from agent_service.agent.registry import AgentRegistry, agent_registry, get_agent
 
 
 @pytest.mark.unit
@@ -185,6 +185,19 @@ class TestAgentRegistry:
 
         assert registry.get("agent") == agent2
 
+    def test_get_agent_uses_global_registry(self):
+        """Test get_agent returns the instance registered globally."""
+        mock_agent = Mock(spec=IAgent)
+        mock_agent.name = "global_test_agent"
+
+        agent_registry.register(mock_agent)
+        try:
+            assert get_agent("global_test_agent") is mock_agent
+        finally:
+            agent_registry.unregister("global_test_agent")
+
+        assert get_agent("global_test_agent") is None
+
 
 @pytest.mark.unit
 class TestAgentContext:
@@ -45,7 +45,7 @@ class TestMCPRoutes:
             mock_tool_schema.description = "A test tool"
             mock_tool_schema.parameters = {"type": "object"}
 
-            with patch("agent_service.api.routes.protocols.tool_registry.list_tools", return_value=[mock_tool_schema]):
+            with patch("agent_service.tools.registry.tool_registry.list_tools", return_value=[mock_tool_schema]):
                 response = await async_client.get("/api/v1/protocols/mcp/tools")
 
         assert response.status_code == 200
@@ -58,7 +58,7 @@ class TestMCPRoutes:
         """Test direct tool invocation via MCP."""
         with patch("agent_service.api.routes.protocols.protocol_registry.is_registered", return_value=True):
             mock_result = {"status": "success", "output": "tool result"}
-            with patch("agent_service.api.routes.protocols.tool_registry.execute", return_value=mock_result):
+            with patch("agent_service.tools.registry.tool_registry.execute", return_value=mock_result):
                 response = await async_client.post(
                     "/api/v1/protocols/mcp/tools/test_tool",
                     json={"arguments": {"param": "value"}}
@@ -73,7 +73,7 @@ class TestMCPRoutes:
     async def test_mcp_tool_not_found(self, async_client: AsyncClient):
         """Test MCP tool invocation with non-existent tool."""
         with patch("agent_service.api.routes.protocols.protocol_registry.is_registered", return_value=True):
-            with patch("agent_service.api.routes.protocols.tool_registry.execute", side_effect=ValueError("Tool not found")):
+            with patch("agent_service.tools.registry.tool_registry.execute", side_effect=ValueError("Tool not found")):
                 response = await async_client.post(
                     "/api/v1/protocols/mcp/tools/nonexistent",
                     json={"arguments": {}}
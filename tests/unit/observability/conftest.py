@@ -0,0 +1,27 @@
+"""
+Observability test fixtures.
+
+Provides:
+- The error tracking module, shared across the test session
+- The API application module, shared across the test session
+"""
+
+from types import ModuleType
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def error_tracking() -> ModuleType:
+    """Provide the error tracking module (cached in sys.modules)."""
+    import agent_service.infrastructure.observability.error_tracking as error_tracking
+
+    return error_tracking
+
+
+@pytest.fixture(scope="session")
+def app_module() -> ModuleType:
+    """Provide the API application module (cached in sys.modules)."""
+    import agent_service.api.app as app_module
+
+    return app_module
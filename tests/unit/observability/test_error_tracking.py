@@ -0,0 +1,112 @@
+# tests/unit/observability/test_error_tracking.py
+"""Unit tests for Sentry error tracking helpers."""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+# Public error tracking functions
+ERROR_TRACKING_API = frozenset({
+    "init_sentry",
+    "set_user_context",
+    "set_request_context",
+    "capture_exception",
+    "capture_message",
+    "clear_user_context",
+    "add_breadcrumb",
+    "set_tag",
+    "set_context",
+    "flush",
+})
+
+@pytest.mark.unit
+class TestErrorTracking:
+    """Test error tracking functions without a configured Sentry DSN."""
+
+    def test_functions_exist(self, error_tracking):
+        """Test the public error tracking API is available."""
+        missing = ERROR_TRACKING_API - set(dir(error_tracking))
+
+        assert not missing, f"Missing: {sorted(missing)}"
+
+    def test_initialization_without_dsn(self, error_tracking):
+        """Test Sentry stays disabled when no DSN is given."""
+        assert error_tracking.init_sentry(dsn=None) is False
+        assert error_tracking.init_sentry(dsn="") is False
+
+    def test_context_functions(self, error_tracking):
+        """Test context helpers are safe to call without Sentry initialized."""
+        error_tracking.set_user_context(user_id="user-123", email="user@example.com")
+        error_tracking.set_tag("component", "tests")
+        error_tracking.set_context("request", {"path": "/health"})
+        error_tracking.add_breadcrumb(message="test breadcrumb", category="test")
+        error_tracking.clear_user_context()
+
+    def test_capture_exception(self, error_tracking):
+        """Test capturing an exception without Sentry initialized."""
+        error = ValueError("test error")
+
+        event_id = error_tracking.capture_exception(error, extra={"key": "value"})
+
+        assert event_id is None or isinstance(event_id, str)
+
+    def test_capture_message(self, error_tracking):
+        """Test capturing a message without Sentry initialized."""
+        event_id = error_tracking.capture_message("test message", level="warning")
+
+        assert event_id is None or isinstance(event_id, str)
+
+    def test_sensitive_data_filtered(self, error_tracking):
+        """Test sensitive headers and query params are scrubbed from events."""
+        event = {
+            "request": {
+                "headers": {"Authorization": "Bearer secret", "Accept": "*/*"},
+                "query_string": "token=abc&page=2",
+            }
+        }
+
+        filtered = error_tracking._filter_sensitive_data(event, {})
+
+        assert filtered["request"]["headers"]["Authorization"] != "Bearer secret"
+        assert filtered["request"]["headers"]["Accept"] == "*/*"
+        assert "abc" not in filtered["request"]["query_string"]
+
+
+@pytest.mark.unit
+async def test_app_lifespan_initializes_and_flushes_sentry(app_module, monkeypatch):
+    """Test the application lifespan initializes Sentry and flushes it on shutdown."""
+    settings = Mock(
+        sentry_dsn="https://key@sentry.example.com/1",
+        sentry_environment=None,
+        environment="local",
+        app_version="1.2.3",
+        sentry_sample_rate=1.0,
+        sentry_traces_sample_rate=0.1,
+        database_url=None,
+        tool_registry_freeze=False,
+    )
+    init_sentry = Mock(return_value=True)
+    flush_sentry = Mock()
+    monkeypatch.setattr(app_module, "get_settings", lambda: settings)
+    monkeypatch.setattr(app_module, "init_sentry", init_sentry)
+    monkeypatch.setattr(app_module, "flush_sentry", flush_sentry)
+    monkeypatch.setattr(app_module, "init_tracing", Mock())
+    monkeypatch.setattr(app_module, "instrument_http_client", Mock())
+    monkeypatch.setattr(app_module, "shutdown_tracing", Mock())
+    monkeypatch.setattr(
+        app_module, "get_redis_manager", AsyncMock(return_value=Mock(is_available=False))
+    )
+    monkeypatch.setattr(app_module, "close_redis", AsyncMock())
+    monkeypatch.setattr(app_module, "db", Mock(_engine=None))
+
+    async with app_module.lifespan(Mock()):
+        init_sentry.assert_called_once_with(
+            dsn="https://key@sentry.example.com/1",
+            environment="local",
+            release="1.2.3",
+            sample_rate=1.0,
+            traces_sample_rate=0.1,
+        )
+        flush_sentry.assert_not_called()
+
+    flush_sentry.assert_called_once_with(timeout=5.0)
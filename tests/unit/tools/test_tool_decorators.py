@@ -0,0 +1,204 @@
+# tests/unit/tools/test_tool_decorators.py
+"""Unit tests for the @tool decorator and schema generation."""
+
+import functools
+from typing import Annotated, Any, Literal, Optional
+
+import pytest
+
+from agent_service.tools.decorators import (
+    defer_registration,
+    tool,
+    _generate_schema_from_function,
+    _get_parameters,
+    _python_type_to_json_schema,
+)
+from agent_service.tools.registry import tool_registry
+
+
+@pytest.mark.unit
+class TestTypeToJsonSchema:
+    """Test Python type to JSON Schema conversion."""
+
+    def test_basic_types(self):
+        """Test basic type mapping."""
+        assert _python_type_to_json_schema(str) == {"type": "string"}
+        assert _python_type_to_json_schema(int) == {"type": "integer"}
+        assert _python_type_to_json_schema(float) == {"type": "number"}
+        assert _python_type_to_json_schema(bool) == {"type": "boolean"}
+        assert _python_type_to_json_schema(Any) == {}
+
+    def test_optional_type(self):
+        """Test Optional[T] is nullable T."""
+        assert _python_type_to_json_schema(Optional[int]) == {
+            "type": "integer",
+            "nullable": True,
+        }
+
+    def test_pep604_optional_type(self):
+        """Test T | None is nullable T."""
+        assert _python_type_to_json_schema(str | None) == {
+            "type": "string",
+            "nullable": True,
+        }
+        assert _python_type_to_json_schema(list[str] | None) == {
+            "type": "array",
+            "items": {"type": "string"},
+            "nullable": True,
+        }
+
+    def test_literal_type(self):
+        """Test Literal values become an enum."""
+        assert _python_type_to_json_schema(Literal["metric", "imperial"]) == {
+            "type": "string",
+            "enum": ["metric", "imperial"],
+        }
+        assert _python_type_to_json_schema(Literal[1, 2, 3]) == {
+            "type": "integer",
+            "enum": [1, 2, 3],
+        }
+        assert _python_type_to_json_schema(Literal[1, "one"]) == {"enum": [1, "one"]}
+
+    def test_nullable_does_not_leak_into_cached_schema(self):
+        """Test marking a union nullable leaves the cached inner schema intact."""
+        _python_type_to_json_schema(list[int] | None)
+
+        assert _python_type_to_json_schema(list[int]) == {
+            "type": "array",
+            "items": {"type": "integer"},
+        }
+
+    def test_unhashable_annotated_metadata(self):
+        """Test Annotated metadata that can't be a cache key still converts."""
+        annotated = Annotated[str, {"max_len": 5}]
+
+        assert _python_type_to_json_schema(annotated) == {"type": "string"}
+        assert _python_type_to_json_schema(list[annotated]) == {
+            "type": "array",
+            "items": {"type": "string"},
+        }
+
+
+
+@pytest.mark.unit
+class TestGetParameters:
+    """Test parameter extraction from functions."""
+
+    def test_plain_function(self):
+        """Test required flags and skipping of *args/**kwargs."""
+
+        def func(a, /, b, c=1, *args, d, e=2, **kwargs):
+            pass
+
+        assert _get_parameters(func) == [
+            ("a", True),
+            ("b", True),
+            ("c", False),
+            ("d", True),
+            ("e", False),
+        ]
+
+    def test_wrapped_function_uses_wrapped_signature(self):
+        """Test functools.wraps wrappers report the wrapped parameters."""
+
+        async def func(query: str, limit: int = 10):
+            pass
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            return await func(*args, **kwargs)
+
+        assert _get_parameters(wrapper) == [("query", True), ("limit", False)]
+
+
+@pytest.mark.unit
+class TestToolDecorator:
+    """Test @tool decorator schema generation."""
+
+    def test_schema_from_signature(self):
+        """Test parameters and required fields come from the signature."""
+
+        @tool(name="lookup", description="Look something up", auto_register=False)
+        async def lookup(query: str, limit: int = 10, tag: str | None = None) -> dict:
+            return {}
+
+        params = lookup.schema.parameters
+        assert params["properties"]["query"] == {"type": "string", "description": ""}
+        assert params["properties"]["tag"]["nullable"] is True
+        assert params["required"] == ["query"]
+
+    def test_identical_signatures_get_independent_parameters(self):
+        """Test identical signatures get equal but independent schemas."""
+
+        async def get_item(item_id: str) -> dict:
+            return {}
+
+        async def delete_item(item_id: str) -> dict:
+            return {}
+
+        first = _generate_schema_from_function(get_item, "get_item", "")
+        second = _generate_schema_from_function(delete_item, "delete_item", "")
+
+        assert first == second
+        assert first["required"] == ["item_id"]
+
+        first["properties"]["item_id"]["description"] = "Item to fetch"
+        first["required"].append("extra")
+
+        assert second["properties"]["item_id"]["description"] == ""
+        assert second["required"] == ["item_id"]
+
+    def test_unhashable_annotated_parameter(self):
+        """Test a parameter with unhashable Annotated metadata decorates."""
+
+        @tool(auto_register=False)
+        async def search(q: Annotated[str, {"max_len": 5}]) -> str:
+            return q
+
+        params = search.schema.parameters
+        assert params["properties"]["q"] == {"type": "string", "description": ""}
+        assert params["required"] == ["q"]
+
+    def test_description_defaults_to_docstring_summary(self):
+        """Test only the first docstring line becomes the description."""
+
+        @tool(auto_register=False)
+        async def documented(value: str) -> str:
+            """
+            Echo a value back.
+
+            Args:
+                value: Value to echo
+            """
+            return value
+
+        assert documented.schema.description == "Echo a value back."
+        assert documented.full_description.startswith("Echo a value back.\n\nArgs:")
+
+    def test_requires_async_function(self):
+        """Test decorating a sync function raises TypeError."""
+        with pytest.raises(TypeError, match="must be async"):
+
+            @tool(auto_register=False)
+            def not_async(value: str) -> str:
+                return value
+
+
+@pytest.mark.unit
+class TestDeferRegistration:
+    """Test batched tool registration."""
+
+    def test_tools_registered_on_exit(self):
+        """Test tools are only registered once the block exits."""
+        try:
+            with defer_registration():
+
+                @tool(name="deferred_tool")
+                async def deferred_tool(value: str) -> str:
+                    return value
+
+                assert tool_registry.get("deferred_tool") is None
+
+            assert tool_registry.get("deferred_tool") is deferred_tool
+        finally:
+            tool_registry.unregister("deferred_tool")
@@ -27,6 +27,21 @@ class TestToolRegistry:
 
         assert registry.get("test_tool") == mock_tool
 
+    def test_register_many(self):
+        """Test registering several tools at once."""
+        registry = ToolRegistry()
+
+        tool1 = Mock(spec=ITool)
+        tool1.schema = ToolSchema(name="tool1", description="First", parameters={})
+
+        tool2 = Mock(spec=ITool)
+        tool2.schema = ToolSchema(name="tool2", description="Second", parameters={})
+
+        registry.register_many([tool1, tool2])
+
+        assert registry.get("tool1") == tool1
+        assert registry.get("tool2") == tool2
+
     def test_unregister_tool(self):
         """Test unregistering a tool."""
         registry = ToolRegistry()
@@ -135,6 +150,49 @@ class TestToolRegistry:
 
         assert registry.get("tool") == tool2
 
+    def test_register_same_tool_keeps_cached_exports(self):
+        """Test re-registering an unchanged tool doesn't rebuild exports."""
+        registry = ToolRegistry()
+
+        tool1 = Mock(spec=ITool)
+        tool1.schema = ToolSchema(name="tool", description="First", parameters={})
+        registry.register(tool1)
+        exports = registry.to_openai_format()
+
+        registry.register(tool1)
+        assert registry.to_openai_format()[0] is exports[0]
+
+        tool2 = Mock(spec=ITool)
+        tool2.schema = ToolSchema(name="tool", description="First", parameters={})
+        registry.register(tool2)
+
+        assert registry.get("tool") is tool2
+        assert registry.to_openai_format()[0] is exports[0]
+
+    def test_freeze(self):
+        """Test a frozen registry serves lookups but rejects changes."""
+        registry = ToolRegistry()
+
+        tool1 = Mock(spec=ITool)
+        tool1.schema = ToolSchema(name="tool1", description="First", parameters={})
+        registry.register(tool1)
+        registry.freeze()
+
+        assert registry.is_frozen
+        assert registry.get("tool1") is tool1
+        assert registry.list_tool_names() == ["tool1"]
+        assert [s.name for s in registry.list_tools()] == ["tool1"]
+        assert registry.to_openai_format()[0] is registry.to_openai_format()[0]
+
+        tool2 = Mock(spec=ITool)
+        tool2.schema = ToolSchema(name="tool2", description="Second", parameters={})
+
+        with pytest.raises(RuntimeError):
+            registry.register(tool2)
+        with pytest.raises(RuntimeError):
+            registry.unregister("tool1")
+        with pytest.raises(RuntimeError):
+            registry.clear()
 
 @pytest.mark.unit
 class TestToolFormats:
@@ -191,6 +249,42 @@ class TestToolFormats:
         assert anthropic_format[0]["description"] == "A test tool"
         assert "param1" in anthropic_format[0]["input_schema"]["properties"]
 
+    def test_export_cache_invalidated_on_register(self):
+        """Test cached exports are reused until the registry changes."""
+        registry = ToolRegistry()
+
+        tool1 = Mock(spec=ITool)
+        tool1.schema = ToolSchema(name="tool1", description="First", parameters={})
+        registry.register(tool1)
+
+        first = registry.to_openai_format()
+        assert registry.to_openai_format()[0] is first[0]
+
+        tool2 = Mock(spec=ITool)
+        tool2.schema = ToolSchema(name="tool2", description="Second", parameters={})
+        registry.register(tool2)
+
+        assert len(registry.to_openai_format()) == 2
+        assert len(registry.to_anthropic_format()) == 2
+
+        registry.unregister("tool1")
+
+        assert [t["name"] for t in registry.to_anthropic_format()] == ["tool2"]
+
+    def test_exports_are_not_shared_lists(self):
+        """Test changing a returned export list doesn't affect later exports."""
+        registry = ToolRegistry()
+
+        tool1 = Mock(spec=ITool)
+        tool1.schema = ToolSchema(name="tool1", description="First", parameters={})
+        registry.register(tool1)
+
+        registry.to_openai_format().append({"type": "function"})
+        registry.to_anthropic_format().clear()
+
+        assert len(registry.to_openai_format()) == 1
+        assert len(registry.to_anthropic_format()) == 1
+
     def test_empty_registry_formats(self):
         """Test export formats with empty registry."""
         registry = ToolRegistry()
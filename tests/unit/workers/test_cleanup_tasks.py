@@ -0,0 +1,95 @@
+# tests/unit/workers/test_cleanup_tasks.py
+"""Unit tests for cleanup tasks."""
+
+from contextlib import asynccontextmanager
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import orjson
+import pytest
+
+from agent_service.workers.tasks import cleanup_tasks
+
+
+class FakeAuditLogSession:
+    """Session over an in-memory audit log table that can fail a delete."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.fail_on_delete = None
+        self.deletes = 0
+        self.commit = AsyncMock()
+        self.rollback = AsyncMock()
+
+    async def stream_scalars(self, stmt):
+        async def _rows():
+            for row in list(self.rows):
+                yield row
+
+        return _rows()
+
+    async def execute(self, stmt):
+        self.deletes += 1
+        if self.deletes == self.fail_on_delete:
+            raise ConnectionError("connection lost")
+        batch = self.rows[:cleanup_tasks._ARCHIVE_DELETE_BATCH]
+        del self.rows[:len(batch)]
+        return SimpleNamespace(rowcount=len(batch))
+
+
+def _audit_log(log_id: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=log_id,
+        user_id=None,
+        action="READ",
+        resource_type="agent",
+        resource_id=None,
+        timestamp=datetime(2020, 1, 1),
+        ip_address=None,
+        user_agent=None,
+        request_id=None,
+        metadata=None,
+    )
+
+
+@pytest.mark.unit
+class TestArchiveOldAuditLogs:
+    """Test audit log archival."""
+
+    def test_retry_after_failed_delete_keeps_deleted_rows_archived(
+        self, tmp_path, monkeypatch
+    ):
+        """Rows deleted before a failure stay in an archive after the retry."""
+        session = FakeAuditLogSession([_audit_log(i) for i in range(5)])
+        session.fail_on_delete = 2
+
+        @asynccontextmanager
+        async def _session():
+            yield session
+
+        monkeypatch.setattr(
+            cleanup_tasks, "db", SimpleNamespace(_engine=object(), session=_session)
+        )
+        monkeypatch.setattr(cleanup_tasks, "_ARCHIVE_DIR", tmp_path)
+        monkeypatch.setattr(cleanup_tasks, "_ARCHIVE_DELETE_BATCH", 2)
+
+        # First run commits one delete batch, then loses the connection
+        with pytest.raises(ConnectionError):
+            cleanup_tasks.archive_old_audit_logs.run()
+        assert [row.id for row in session.rows] == [2, 3, 4]
+
+        # The retry archives and deletes the rest
+        session.fail_on_delete = None
+        result = cleanup_tasks.archive_old_audit_logs.run()
+        assert result["status"] == "success"
+        assert session.rows == []
+
+        archives = sorted(tmp_path.glob("audit_logs_*.jsonl"))
+        assert len(archives) == 2
+        archived_ids = {
+            orjson.loads(line)["id"]
+            for archive in archives
+            for line in archive.read_bytes().splitlines()
+        }
+        assert archived_ids == set(range(5))